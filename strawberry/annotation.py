@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import sys
 import typing
 from collections import abc
@@ -8,9 +9,11 @@ from typing import (  # type: ignore[attr-defined]
     TYPE_CHECKING,
     Any,
     Dict,
+    FrozenSet,
     List,
     Optional,
     Sequence,
+    Type,
     TypeVar,
     Union,
     _eval_type,
@@ -46,109 +49,126 @@ if TYPE_CHECKING:
     from strawberry.union import StrawberryUnion
 
 
-ASYNC_TYPES = (
-    abc.AsyncGenerator,
-    abc.AsyncIterable,
-    abc.AsyncIterator,
-    typing.AsyncContextManager,
-    typing.AsyncGenerator,
-    typing.AsyncIterable,
-    typing.AsyncIterator,
+ASYNC_TYPES = frozenset(
+    (
+        abc.AsyncGenerator,
+        abc.AsyncIterable,
+        abc.AsyncIterator,
+        typing.AsyncContextManager,
+        typing.AsyncGenerator,
+        typing.AsyncIterable,
+        typing.AsyncIterator,
+    )
 )
 
+_LIST_ORIGINS = frozenset((list, tuple, abc.Sequence))
+
+# Strawberry types that can be returned as they are by `resolve`. The exact type is
+# looked up first, `isinstance` is only needed for subclasses of these classes
+_STRAWBERRY_TYPE_CLASSES = (
+    EnumDefinition,
+    StrawberryList,
+    StrawberryOptional,
+    ScalarDefinition,  # TODO: Replace with StrawberryScalar
+    TypeDefinition,
+)
+_STRAWBERRY_TYPES: FrozenSet[type] = frozenset(_STRAWBERRY_TYPE_CLASSES)
+
+_NoneType = type(None)
+_UnsetType = type(UNSET)
+
+_strawberry_union_class: Optional[Type[StrawberryUnion]] = None
+
+
+def _get_strawberry_union_class() -> Type[StrawberryUnion]:
+    # `strawberry.union` imports this module, so we can only import it lazily. Doing
+    # it only once avoids going through the import machinery on every call
+    global _strawberry_union_class
+
+    if _strawberry_union_class is None:
+        from strawberry.union import StrawberryUnion
+
+        _strawberry_union_class = StrawberryUnion
+
+    return _strawberry_union_class
+
 
 class StrawberryAnnotation:
+    __slots__ = ("annotation", "namespace", "_resolve_cache", "_hash_cache")
+
     def __init__(
         self, annotation: Union[object, str], *, namespace: Optional[Dict] = None
     ):
         self.annotation = annotation
         self.namespace = namespace
 
+        self._resolve_cache: Optional[Union[StrawberryType, type]] = None
+        self._hash_cache: Optional[int] = None
+
     def __hash__(self) -> int:
-        return hash(self.resolve())
+        if self._hash_cache is None:
+            self._hash_cache = hash(self.resolve())
+        return self._hash_cache
 
     def __eq__(self, other: object) -> bool:
         return self.resolve() == other
 
     @staticmethod
     def parse_annotated(annotation: object) -> object:
-        annotation_origin = get_origin(annotation)
-
-        if annotation_origin is Annotated:
-            args = get_args(annotation)
-            base_type = args[0]
-            annotated_args: Sequence[Any] = args[1:]
-
-            for arg in annotated_args:
-                if isinstance(arg, StrawberryLazyReference):
-                    assert isinstance(base_type, ForwardRef)
-                    base_type = arg.resolve_forward_ref(base_type)
-                    annotated_args = [
-                        arg
-                        for arg in annotated_args
-                        if not isinstance(arg, StrawberryLazyReference)
-                    ]
-
-            base_type = StrawberryAnnotation.parse_annotated(base_type)
-            if annotated_args:
-                base_type = Annotated[(base_type, *annotated_args)]
-            return base_type
-
-        elif is_union(annotation):
-            return Union[
-                tuple(
-                    StrawberryAnnotation.parse_annotated(arg)
-                    for arg in get_args(annotation)
-                )  # pyright: ignore
-            ]  # pyright: ignore
-
-        elif is_list(annotation):
-            return List[StrawberryAnnotation.parse_annotated(get_args(annotation)[0])]  # type: ignore  # noqa: E501
-
-        elif annotation_origin and is_generic(annotation_origin):
-            args = get_args(annotation)
-
-            return annotation_origin[
-                tuple(StrawberryAnnotation.parse_annotated(arg) for arg in args)
-            ]
-
-        return annotation
+        return parse_annotated(annotation)
 
     def resolve(self) -> Union[StrawberryType, type]:
-        annotation = self.parse_annotated(self.annotation)
+        # Resolving is done many times for the same annotation (field access,
+        # argument conversion, hashing...) and always produces the same result,
+        # so we only do it once
+        if self._resolve_cache is None:
+            self._resolve_cache = self._resolve()
+        return self._resolve_cache
+
+    def _resolve(self) -> Union[StrawberryType, type]:
+        annotation = parse_annotated(self.annotation)
 
         if isinstance(self.annotation, str):
             annotation = ForwardRef(self.annotation)
 
         evaled_type = _eval_type(annotation, self.namespace, None)
 
-        evaled_type, evaled_args = StrawberryAnnotated.get_type_and_args(evaled_type)
+        evaled_args: Sequence[Any] = ()
+        if _has_annotated_metadata(evaled_type):
+            evaled_type, evaled_args = StrawberryAnnotated.get_type_and_args(
+                evaled_type
+            )
+
+        # `__origin__` is needed by most of the checks below, fetch it only once
+        origin: Any = getattr(evaled_type, "__origin__", None)
 
-        if self._is_async_type(evaled_type):
-            evaled_type = self._strip_async_type(evaled_type)
+        if origin in ASYNC_TYPES:
+            evaled_type = evaled_type.__args__[0]
+            origin = getattr(evaled_type, "__origin__", None)
 
-        if self._is_lazy_type(evaled_type):
+        if _is_lazy_type(evaled_type):
             ret = evaled_type
 
-        elif self._is_generic(evaled_type):
+        elif is_generic(origin):
             if any(is_type_var(type_) for type_ in evaled_type.__args__):
                 ret = evaled_type
             else:
                 ret = self.create_concrete_type(evaled_type)
         # Simply return objects that are already StrawberryTypes
-        elif self._is_strawberry_type(evaled_type):
+        elif _is_strawberry_type(evaled_type):
             ret = evaled_type
 
         # Everything remaining should be a raw annotation that needs to be turned into
         # a StrawberryType
-        elif self._is_enum(evaled_type):
+        elif _is_enum(evaled_type):
             ret = self.create_enum(evaled_type)
-        elif self._is_list(evaled_type):
+        elif _is_list(origin):
             ret = self.create_list(evaled_type)
-        elif self._is_optional(evaled_type):
-            ret = self.create_optional(evaled_type)
-        elif self._is_union(evaled_type):
-            ret = self.create_union(evaled_type)
+        elif _is_union(evaled_type, origin):
+            if _is_optional(evaled_type):
+                ret = self.create_optional(evaled_type)
+            else:
+                ret = self.create_union(evaled_type)
         elif is_type_var(evaled_type):
             ret = self.create_type_var(evaled_type)
         else:
@@ -185,10 +205,7 @@ class StrawberryAnnotation:
     def create_optional(self, evaled_type: Any) -> StrawberryOptional:
         types = evaled_type.__args__
         non_optional_types = tuple(
-            filter(
-                lambda x: x is not type(None) and x is not type(UNSET),  # noqa: E721
-                types,
-            )
+            x for x in types if x is not _NoneType and x is not _UnsetType
         )
 
         # Note that passing a single type to `Union` is equivalent to not using `Union`
@@ -209,8 +226,7 @@ class StrawberryAnnotation:
         return StrawberryTypeVar(evaled_type)
 
     def create_union(self, evaled_type) -> StrawberryUnion:
-        # Prevent import cycles
-        from strawberry.union import StrawberryUnion
+        StrawberryUnion = _get_strawberry_union_class()
 
         # TODO: Deal with Forward References/origin
         if isinstance(evaled_type, StrawberryUnion):
@@ -222,120 +238,157 @@ class StrawberryAnnotation:
         )
         return union
 
-    @classmethod
-    def _is_async_type(cls, annotation: type) -> bool:
-        origin = getattr(annotation, "__origin__", None)
-        return origin in ASYNC_TYPES
 
-    @classmethod
-    def _is_enum(cls, annotation: Any) -> bool:
-        # Type aliases are not types so we need to make sure annotation can go into
-        # issubclass
-        if not isinstance(annotation, type):
-            return False
-        return issubclass(annotation, Enum)
+def _has_annotated_metadata(annotation: Any) -> bool:
+    return (
+        type(annotation) is StrawberryAnnotated or get_origin(annotation) is Annotated
+    )
 
-    @classmethod
-    def _is_generic(cls, annotation: Any) -> bool:
-        if hasattr(annotation, "__origin__"):
-            return is_generic(annotation.__origin__)
 
+def _is_enum(annotation: Any) -> bool:
+    # Type aliases are not types so we need to make sure annotation can go into
+    # issubclass
+    if not isinstance(annotation, type):
         return False
+    return issubclass(annotation, Enum)
 
-    @classmethod
-    def _is_lazy_type(cls, annotation: Any) -> bool:
-        return isinstance(annotation, LazyType)
 
-    @classmethod
-    def _is_optional(cls, annotation: Any) -> bool:
-        """Returns True if the annotation is Optional[SomeType]"""
+def _is_lazy_type(annotation: Any) -> bool:
+    return isinstance(annotation, LazyType)
 
-        # Optionals are represented as unions
-        if not cls._is_union(annotation):
-            return False
 
-        types = annotation.__args__
+def _is_optional(annotation: Any) -> bool:
+    """Returns True if the union annotation is Optional[SomeType]"""
 
-        # A Union to be optional needs to have at least one None type
-        return any(x is type(None) for x in types)  # noqa: E721
+    types = annotation.__args__
 
-    @classmethod
-    def _is_list(cls, annotation: Any) -> bool:
-        """Returns True if annotation is a List"""
+    # A Union to be optional needs to have at least one None type
+    return any(x is _NoneType for x in types)
 
-        annotation_origin = getattr(annotation, "__origin__", None)
 
-        return (
-            annotation_origin == list
-            or annotation_origin == tuple
-            or annotation_origin is abc.Sequence
-        )
+def _is_list(annotation_origin: Any) -> bool:
+    """Returns True if the annotation origin is the one of a List"""
 
-    @classmethod
-    def _is_strawberry_type(cls, evaled_type: Any) -> bool:
-        # Prevent import cycles
-        from strawberry.union import StrawberryUnion
+    return annotation_origin in _LIST_ORIGINS
 
-        if isinstance(evaled_type, EnumDefinition):
-            return True
-        elif _is_input_type(evaled_type):  # TODO: Replace with StrawberryInputObject
-            return True
+
+def _is_strawberry_type(evaled_type: Any) -> bool:
+    StrawberryUnion = _get_strawberry_union_class()
+
+    type_class = type(evaled_type)
+
+    return (
+        type_class in _STRAWBERRY_TYPES
+        or type_class is StrawberryUnion
         # TODO: add support for StrawberryInterface when implemented
-        elif isinstance(evaled_type, StrawberryList):
-            return True
-        elif _is_object_type(evaled_type):  # TODO: Replace with StrawberryObject
-            return True
-        elif isinstance(evaled_type, TypeDefinition):
-            return True
-        elif isinstance(evaled_type, StrawberryOptional):
-            return True
-        elif isinstance(
-            evaled_type, ScalarDefinition
-        ):  # TODO: Replace with StrawberryScalar
-            return True
-        elif isinstance(evaled_type, StrawberryUnion):
+        # Input types are object types too
+        # TODO: Replace with StrawberryObject and StrawberryInputObject
+        or _is_object_type(evaled_type)
+        # Subclasses don't match the exact type checks above
+        or isinstance(evaled_type, (*_STRAWBERRY_TYPE_CLASSES, StrawberryUnion))
+    )
+
+
+def _is_union(annotation: Any, annotation_origin: Any) -> bool:
+    """Returns True if annotation is a Union"""
+
+    # this check is needed because unions declared with the new syntax `A | B`
+    # don't have a `__origin__` property on them, but they are instances of
+    # `UnionType`, which is only available in Python 3.10+
+    if sys.version_info >= (3, 10):
+        from types import UnionType
+
+        if isinstance(annotation, UnionType):
             return True
 
-        return False
+    # unions declared as Union[A, B] fall through to this check, even on python 3.10+
 
-    @classmethod
-    def _is_union(cls, annotation: Any) -> bool:
-        """Returns True if annotation is a Union"""
+    return annotation_origin is typing.Union
 
-        # this check is needed because unions declared with the new syntax `A | B`
-        # don't have a `__origin__` property on them, but they are instances of
-        # `UnionType`, which is only available in Python 3.10+
-        if sys.version_info >= (3, 10):
-            from types import UnionType
 
-            if isinstance(annotation, UnionType):
-                return True
+def parse_annotated(annotation: object) -> object:
+    """Resolves lazy references in `Annotated` args, recursively.
 
-        # unions declared as Union[A, B] fall through to this check, even on python 3.10+
+    The same annotation objects (e.g. `Optional[str]`) are shared all over a schema,
+    so the results are kept in a bounded cache. Annotations with a lazy reference are
+    usually only used once, so they are not cached
+    """
+    # Plain classes, forward references and lazy types can't contain anything to
+    # parse
+    if isinstance(annotation, (str, LazyType)) or (
+        isinstance(annotation, type) and not hasattr(annotation, "__origin__")
+    ):
+        return annotation
 
-        annotation_origin = getattr(annotation, "__origin__", None)
+    # `__metadata__` holds the args of `Annotated` aliases
+    if any(
+        isinstance(arg, StrawberryLazyReference)
+        for arg in getattr(annotation, "__metadata__", ())
+    ):
+        return _parse_annotated(annotation)
 
-        return annotation_origin is typing.Union
+    try:
+        return _parse_annotated_cached(id(annotation), annotation)
+    except TypeError:
+        # Annotations with unhashable metadata can't be cached
+        return _parse_annotated(annotation)
 
-    @classmethod
-    def _strip_async_type(cls, annotation) -> type:
-        return annotation.__args__[0]
 
-    @classmethod
-    def _strip_lazy_type(cls, annotation: LazyType) -> type:
-        return annotation.resolve_type()
+@functools.lru_cache(maxsize=4096)
+def _parse_annotated_cached(_annotation_id: int, annotation: object) -> object:
+    # Distinct annotations can compare equal (e.g. with `LazyType`s that reference
+    # the same type), so the id is part of the key to give each its own result
+    return _parse_annotated(annotation)
 
 
-################################################################################
-# Temporary functions to be removed with new types
-################################################################################
+def _parse_annotated(annotation: object) -> object:
+    annotation_origin = get_origin(annotation)
 
+    if annotation_origin is Annotated:
+        args = get_args(annotation)
+        base_type = args[0]
+        annotated_args: Sequence[Any] = args[1:]
 
-def _is_input_type(type_: Any) -> bool:
-    if not _is_object_type(type_):
-        return False
+        lazy_reference = next(
+            (arg for arg in annotated_args if isinstance(arg, StrawberryLazyReference)),
+            None,
+        )
+
+        if lazy_reference is not None:
+            assert isinstance(base_type, ForwardRef)
+            base_type = lazy_reference.resolve_forward_ref(base_type)
+            annotated_args = tuple(
+                arg
+                for arg in annotated_args
+                if not isinstance(arg, StrawberryLazyReference)
+            )
+
+        base_type = parse_annotated(base_type)
+        if annotated_args:
+            base_type = Annotated[(base_type, *annotated_args)]
+        return base_type
+
+    elif is_union(annotation):
+        return Union[
+            tuple(
+                parse_annotated(arg) for arg in get_args(annotation)
+            )  # pyright: ignore
+        ]  # pyright: ignore
+
+    elif is_list(annotation):
+        return List[parse_annotated(get_args(annotation)[0])]  # type: ignore
 
-    return type_._type_definition.is_input
+    elif annotation_origin and is_generic(annotation_origin):
+        args = get_args(annotation)
+
+        return annotation_origin[tuple(parse_annotated(arg) for arg in args)]
+
+    return annotation
+
+
+################################################################################
+# Temporary functions to be removed with new types
+################################################################################
 
 
 def _is_object_type(type_: Any) -> bool:
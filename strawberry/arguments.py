@@ -6,12 +6,14 @@ import warnings
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     ForwardRef,
     Iterable,
     List,
     Mapping,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -23,6 +25,7 @@ from strawberry.enum import EnumDefinition
 from strawberry.lazy_type import LazyType, StrawberryLazyReference
 from strawberry.type import (
     StrawberryAnnotated,
+    StrawberryContainer,
     StrawberryList,
     StrawberryOptional,
     StrawberryType,
@@ -36,6 +39,7 @@ from .unset import UNSET as _deprecated_UNSET, _deprecated_is_unset  # noqa
 
 if TYPE_CHECKING:
     from strawberry.schema.config import StrawberryConfig
+    from strawberry.schema.name_converter import NameConverter
 
 DEPRECATED_NAMES: Dict[str, str] = {
     "UNSET": (
@@ -45,6 +49,12 @@ DEPRECATED_NAMES: Dict[str, str] = {
     "is_unset": "`is_unset` is deprecated use `value is UNSET` instead",
 }
 
+# Used to look up values that may not be present with a single dict access
+_MISSING = object()
+
+# Converters of input types, keyed by the input type
+_InputConverters = Dict[type, Callable[..., object]]
+
 
 @dataclasses.dataclass(frozen=True)
 class StrawberryArgumentAnnotation:
@@ -56,6 +66,20 @@ class StrawberryArgumentAnnotation:
 
 
 class StrawberryArgument:
+    __slots__ = (
+        "python_name",
+        "graphql_name",
+        "is_subscription",
+        "description_sources",
+        "description",
+        "_type",
+        "type_annotation",
+        "deprecation_reason",
+        "directives",
+        "default",
+        "_name_cache",
+    )
+
     def __init__(
         self,
         python_name: str,
@@ -73,10 +97,13 @@ class StrawberryArgument:
         self.is_subscription = is_subscription
         self.description_sources = description_sources
         self.description = description
-        self._type: Optional[StrawberryType] = None
+        self._type: Optional[Union[StrawberryType, type]] = None
+        """The resolved type, see `type`"""
         self.type_annotation = type_annotation
         self.deprecation_reason = deprecation_reason
         self.directives = directives
+        self._name_cache: Optional[Tuple[NameConverter, str]] = None
+        """The last name converter used on this argument, and the name it returned"""
 
         # TODO: Consider moving this logic to a function
         self.default = (
@@ -87,7 +114,11 @@ class StrawberryArgument:
 
     @property
     def type(self) -> Union[StrawberryType, type]:
-        return self.type_annotation.resolve()
+        # The type is read for every argument on every request, so we only resolve
+        # it once
+        if self._type is None:
+            self._type = self.type_annotation.resolve()
+        return self._type
 
     def _parse_annotated(self):
         base_type, annotated_args = StrawberryAnnotated.get_type_and_args(
@@ -127,61 +158,202 @@ class StrawberryArgument:
                 )
 
 
+def _is_passthrough_type(
+    type_: Union[StrawberryType, type],
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+) -> bool:
+    """Returns True if `convert_argument` returns values of this type as they are"""
+
+    while type(type_) is StrawberryOptional or type(type_) is StrawberryAnnotated:
+        type_ = cast(StrawberryContainer, type_).of_type
+
+    return type(type_) is EnumDefinition or is_scalar(type_, scalar_registry)
+
+
+def _convert_passthrough(
+    value: object,
+    type_: Union[StrawberryType, type],
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    input_converters: Optional[_InputConverters] = None,
+) -> object:
+    return value
+
+
+def _convert_of_type(
+    value: object,
+    type_: Union[StrawberryOptional, StrawberryAnnotated],
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    input_converters: Optional[_InputConverters],
+) -> object:
+    return convert_argument(
+        value, type_.of_type, scalar_registry, config, input_converters
+    )
+
+
+def _convert_list(
+    value: Iterable,
+    type_: StrawberryList,
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    input_converters: Optional[_InputConverters],
+) -> object:
+    of_type = type_.of_type
+
+    # Scalars and enums are returned as they are, no need to go through each item
+    if _is_passthrough_type(of_type, scalar_registry):
+        return list(value)
+
+    return [
+        convert_argument(x, of_type, scalar_registry, config, input_converters)
+        for x in value
+    ]
+
+
+def _convert_enum(
+    value: object,
+    type_: EnumDefinition,
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    input_converters: Optional[_InputConverters],
+) -> object:
+    return value
+
+
+def _convert_lazy_type(
+    value: object,
+    type_: LazyType,
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    input_converters: Optional[_InputConverters],
+) -> object:
+    return convert_argument(
+        value, type_.resolve_type(), scalar_registry, config, input_converters
+    )
+
+
+# Converters for the strawberry types, keyed by their exact class so that
+# dispatching only costs a single dict lookup. Subclasses are looked up with
+# `isinstance` in `convert_argument`, after every other check
+_CONVERTERS: Dict[type, Callable[..., object]] = {
+    StrawberryOptional: _convert_of_type,
+    StrawberryAnnotated: _convert_of_type,
+    StrawberryList: _convert_list,
+    EnumDefinition: _convert_enum,
+    LazyType: _convert_lazy_type,
+}
+
+
+def _compile_input_converter(
+    type_: type,
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+) -> Callable[..., object]:
+    type_definition: TypeDefinition = type_._type_definition  # type: ignore
+
+    assert type_definition.is_input
+
+    # The GraphQL names, the types and how to convert the fields never change for a
+    # given input type, scalar registry and name converter, so we compute them only
+    # once instead of doing it for every value we convert
+    field_plan = tuple(
+        (
+            config.name_converter.from_field(field),
+            field.python_name,
+            field.type,
+            _convert_passthrough
+            if _is_passthrough_type(field.type, scalar_registry)
+            else convert_argument,
+        )
+        for field in type_definition.fields
+    )
+
+    def convert(
+        value: Mapping,
+        scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+        config: StrawberryConfig,
+        input_converters: Optional[_InputConverters],
+    ) -> object:
+        kwargs = {}
+
+        for graphql_name, python_name, field_type, field_converter in field_plan:
+            field_value = value.get(graphql_name, _MISSING)
+
+            if field_value is not _MISSING:
+                kwargs[python_name] = field_converter(
+                    field_value, field_type, scalar_registry, config, input_converters
+                )
+
+        return type_(**kwargs)
+
+    return convert
+
+
 def convert_argument(
     value: object,
     type_: Union[StrawberryType, type],
     scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
     config: StrawberryConfig,
+    input_converters: Optional[_InputConverters] = None,
 ) -> object:
+    """Converts a value of the given type to its python value.
+
+    `input_converters` caches the converters of the input types, it must only be
+    shared between calls that use the same scalar registry and config."""
+
     if value is None:
         return None
 
     if value is _deprecated_UNSET:
         return _deprecated_UNSET
 
-    if isinstance(type_, (StrawberryOptional, StrawberryAnnotated)):
-        return convert_argument(value, type_.of_type, scalar_registry, config)
-
-    if isinstance(type_, StrawberryList):
-        value_list = cast(Iterable, value)
-        return [
-            convert_argument(x, type_.of_type, scalar_registry, config)
-            for x in value_list
-        ]
+    converter = _CONVERTERS.get(type(type_))
+    if converter is not None:
+        return converter(value, type_, scalar_registry, config, input_converters)
 
     if is_scalar(type_, scalar_registry):
         return value
 
-    if isinstance(type_, EnumDefinition):
-        return value
-
-    if isinstance(type_, LazyType):
-        return convert_argument(value, type_.resolve_type(), scalar_registry, config)
-
     if hasattr(type_, "_enum_definition"):
         enum_definition: EnumDefinition = type_._enum_definition  # type: ignore
-        return convert_argument(value, enum_definition, scalar_registry, config)
+        return convert_argument(
+            value, enum_definition, scalar_registry, config, input_converters
+        )
 
     if hasattr(type_, "_type_definition"):  # TODO: Replace with StrawberryInputObject
-        type_definition: TypeDefinition = type_._type_definition  # type: ignore
+        type_ = cast(type, type_)
+        value = cast(Mapping, value)
 
-        assert type_definition.is_input
+        if input_converters is None:
+            converter = _compile_input_converter(type_, scalar_registry, config)
+        else:
+            converter = input_converters.get(type_)
+            if converter is None:
+                converter = _compile_input_converter(type_, scalar_registry, config)
+                input_converters[type_] = converter
 
-        kwargs = {}
+        return converter(value, scalar_registry, config, input_converters)
 
-        for field in type_definition.fields:
-            value = cast(Mapping, value)
-            graphql_name = config.name_converter.from_field(field)
+    for type_class, converter in _CONVERTERS.items():
+        if isinstance(type_, type_class):
+            return converter(value, type_, scalar_registry, config, input_converters)
 
-            if graphql_name in value:
-                kwargs[field.python_name] = convert_argument(
-                    value[graphql_name], field.type, scalar_registry, config
-                )
+    raise UnsupportedTypeError(type_)
 
-        type_ = cast(type, type_)
-        return type_(**kwargs)
 
-    raise UnsupportedTypeError(type_)
+def _get_argument_name(
+    argument: StrawberryArgument, name_converter: NameConverter
+) -> str:
+    # The GraphQL name of an argument doesn't change for a given name converter, so
+    # we avoid converting it on every request
+    cached = argument._name_cache
+
+    if cached is None or cached[0] is not name_converter:
+        cached = (name_converter, name_converter.from_argument(argument))
+        argument._name_cache = cached
+
+    return cached[1]
 
 
 def convert_arguments(
@@ -199,15 +371,15 @@ def convert_arguments(
         return {}
 
     kwargs = {}
+    name_converter = config.name_converter
 
     for argument in arguments:
         assert argument.python_name
 
-        name = config.name_converter.from_argument(argument)
-
-        if name in value:
-            current_value = value[name]
+        name = _get_argument_name(argument, name_converter)
+        current_value = value.get(name, _MISSING)
 
+        if current_value is not _MISSING:
             kwargs[argument.python_name] = convert_argument(
                 value=current_value,
                 type_=argument.type,
@@ -218,6 +390,54 @@ def convert_arguments(
     return kwargs
 
 
+def compile_arguments_converter(
+    arguments: List[StrawberryArgument],
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    input_converters: Optional[_InputConverters] = None,
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Returns a function that does the same as `convert_arguments`.
+
+    The names, the types and how to convert the arguments are computed upfront,
+    so that they're not looked up again every time the arguments are converted.
+    The converters of the input types are kept in `input_converters`, which can be
+    shared by all the arguments converters of a schema."""
+
+    if input_converters is None:
+        input_converters = {}
+
+    argument_plan = tuple(
+        (
+            _get_argument_name(argument, config.name_converter),
+            argument.python_name,
+            argument.type,
+            _convert_passthrough
+            if _is_passthrough_type(argument.type, scalar_registry)
+            else convert_argument,
+        )
+        for argument in arguments
+    )
+
+    def convert(value: Dict[str, Any]) -> Dict[str, Any]:
+        kwargs = {}
+
+        for name, python_name, argument_type, converter in argument_plan:
+            current_value = value.get(name, _MISSING)
+
+            if current_value is not _MISSING:
+                kwargs[python_name] = converter(
+                    current_value,
+                    argument_type,
+                    scalar_registry,
+                    config,
+                    input_converters,
+                )
+
+        return kwargs
+
+    return convert
+
+
 def argument(
     *,
     description_sources: Optional[DescriptionSources] = None,
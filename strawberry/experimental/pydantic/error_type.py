@@ -1,6 +1,6 @@
 import dataclasses
 import warnings
-from typing import Any, List, Optional, Sequence, Tuple, Type, cast
+from typing import Any, List, Optional, Sequence, Type
 
 from pydantic import BaseModel
 from pydantic.fields import ModelField
@@ -9,12 +9,10 @@ from pydantic.utils import lenient_issubclass
 from strawberry.auto import StrawberryAuto
 from strawberry.description_sources import DescriptionSources
 from strawberry.experimental.pydantic.utils import (
-    get_private_fields,
     get_strawberry_type_from_model,
     normalize_type,
 )
-from strawberry.object_type import _process_type, _wrap_dataclass
-from strawberry.types.type_resolver import _get_fields
+from strawberry.object_type import _check_field_annotations, _process_type
 from strawberry.utils.docstrings import Docstring
 from strawberry.utils.typing import get_list_annotation, is_list
 
@@ -29,24 +27,24 @@ def get_type_for_field(field: ModelField):
 
 def field_type_to_type(type_):
     error_class: Any = str
-    strawberry_type: Any = error_class
 
-    if is_list(type_):
-        child_type = get_list_annotation(type_)
+    # Errors of nested lists are reported per level, so we first find the type of
+    # the items and then wrap its error type once per list level
+    list_depth = 0
+    while is_list(type_):
+        list_depth += 1
+        type_ = get_list_annotation(type_)
 
-        if is_list(child_type):
-            strawberry_type = field_type_to_type(child_type)
-        elif lenient_issubclass(child_type, BaseModel):
-            strawberry_type = get_strawberry_type_from_model(child_type)
-        else:
-            strawberry_type = List[error_class]
+    strawberry_type: Any
+    if lenient_issubclass(type_, BaseModel):
+        strawberry_type = Optional[get_strawberry_type_from_model(type_)]
+    else:
+        strawberry_type = Optional[List[error_class]]
 
-        strawberry_type = Optional[strawberry_type]
-    elif lenient_issubclass(type_, BaseModel):
-        strawberry_type = get_strawberry_type_from_model(type_)
-        return Optional[strawberry_type]
+    for _ in range(list_depth):
+        strawberry_type = Optional[List[strawberry_type]]
 
-    return Optional[List[strawberry_type]]
+    return strawberry_type
 
 
 def error_type(
@@ -57,7 +55,7 @@ def error_type(
     description_sources: Optional[DescriptionSources] = None,
     description: Optional[str] = None,
     directives: Optional[Sequence[object]] = (),
-    all_fields: bool = False
+    all_fields: bool = False,
 ):
     def wrap(cls):
         model_fields = model.__fields__
@@ -90,36 +88,34 @@ def error_type(
         if not fields_set:
             raise MissingFieldsListError(cls)
 
-        all_model_fields: List[Tuple[str, Any, dataclasses.Field]] = [
-            (
-                name,
-                get_type_for_field(field),
-                dataclasses.field(default=None),  # type: ignore[arg-type]
-            )
+        # Make sure all the fields (including the ones defined with resolvers) are
+        # annotated, so that we can build the list of fields of the dataclass
+        _check_field_annotations(cls)
+
+        annotations = {
+            name: get_type_for_field(field)
             for name, field in model_fields.items()
             if name in fields_set
-        ]
+        }
+        for field_name in annotations:
+            # Keep the defaults defined on the class itself
+            if field_name not in cls.__dict__:
+                setattr(cls, field_name, dataclasses.field(default=None))
 
-        docstring = Docstring(cls)
-        wrapped = _wrap_dataclass(cls)
-        extra_fields = cast(List[dataclasses.Field], _get_fields(wrapped))
-        private_fields = get_private_fields(wrapped)
-
-        all_model_fields.extend(
-            (
-                field.name,
-                field.type,
-                field,
-            )
-            for field in extra_fields + private_fields
-            if not isinstance(field.type, StrawberryAuto)
-        )
+        for field_name, type_ in cls.__annotations__.items():
+            if isinstance(type_, StrawberryAuto):
+                continue
 
-        cls = dataclasses.make_dataclass(
-            cls.__name__,
-            all_model_fields,
-            bases=cls.__bases__,
-        )
+            if field_name in annotations:
+                raise TypeError(f"Field name duplicated: {field_name!r}")
+
+            annotations[field_name] = type_
+
+        # Turn the class itself into a dataclass with both the model and the extra
+        # fields, instead of creating the dataclass twice
+        docstring = Docstring(cls)
+        cls.__annotations__ = annotations
+        cls = dataclasses.dataclass(cls)
 
         _process_type(
             cls,
@@ -37,7 +37,6 @@ from strawberry.experimental.pydantic.utils import (
 from strawberry.field import StrawberryField
 from strawberry.object_type import _process_type, _wrap_dataclass
 from strawberry.types.type_resolver import _get_fields
-from strawberry.utils.dataclasses import add_custom_init_fn
 from strawberry.utils.docstrings import Docstring
 
 
@@ -234,6 +233,8 @@ def type(
         )
 
         if sys.version_info < (3, 10):
+            from strawberry.utils.dataclasses import add_custom_init_fn
+
             add_custom_init_fn(cls)
 
         _process_type(
@@ -2,6 +2,7 @@ import builtins
 import dataclasses
 import inspect
 import sys
+import types
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,6 +13,7 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -27,7 +29,6 @@ from strawberry.exceptions import InvalidDefaultFactoryError, InvalidFieldArgume
 from strawberry.type import StrawberryAnnotated, StrawberryType, StrawberryTypeVar
 from strawberry.types.info import Info, current_info
 from strawberry.union import StrawberryUnion
-from strawberry.utils.cached_property import cached_property
 from strawberry.utils.docstrings import Docstring
 
 from .permission import BasePermission
@@ -50,10 +51,84 @@ _RESOLVER_TYPE = Union[
 
 UNRESOLVED = object()
 
+_DEFAULT_FROM_FACTORY = object()
+
+# kw_only was added to python 3.10 and it is required
+_FIELD_KWARGS: Dict[str, Any] = (
+    {"kw_only": dataclasses.MISSING} if sys.version_info >= (3, 10) else {}
+)
+
+
+def _check_default_factory(default_factory: Callable[..., object]) -> None:
+    """Raises `InvalidDefaultFactoryError` if the factory needs any arguments.
+
+    Python functions are checked from their code object, which is much cheaper
+    than `inspect.signature`. Builtin functions (e.g. `round`) go through
+    `inspect.signature`, and other callables (e.g. classes) are checked when they're
+    called."""
+
+    if isinstance(default_factory, types.BuiltinFunctionType):
+        try:
+            inspect.signature(default_factory).bind()
+        except ValueError:
+            # There's no signature to check
+            return
+        except TypeError as exc:
+            raise InvalidDefaultFactoryError() from exc
+        return
+
+    # Bound methods expose the code of their function, including `self`
+    function = getattr(default_factory, "__func__", default_factory)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return
+
+    has_self = function is not default_factory
+    positional_defaults = len(function.__defaults__ or ())
+    if code.co_argcount - has_self > positional_defaults:
+        raise InvalidDefaultFactoryError()
+
+    keyword_only = code.co_varnames[
+        code.co_argcount : code.co_argcount + code.co_kwonlyargcount
+    ]
+    keyword_defaults = function.__kwdefaults__ or {}
+    if any(name not in keyword_defaults for name in keyword_only):
+        raise InvalidDefaultFactoryError()
+
+
+def _is_async_permission_class(permission_class: Type[BasePermission]) -> bool:
+    has_permission = permission_class.has_permission
+
+    # Permission classes that don't subclass `BasePermission` have no cached flag
+    cached = getattr(permission_class, "_is_async", None)
+    if cached is not None and cached[0] is has_permission:
+        return cached[1]
+
+    return inspect.iscoroutinefunction(has_permission)
+
 
 class StrawberryField(dataclasses.Field):
+    __slots__ = (
+        "default_resolver",
+        "graphql_name",
+        "type_annotation",
+        "description_sources",
+        "description",
+        "origin",
+        "_default_value",
+        "is_subscription",
+        "explicit_permission_classes",
+        "directives",
+        "deprecation_reason",
+        "_base_resolver",
+        "_resolver_docstring",
+        "_permission_classes",
+        "_is_async",
+        "_type_cache",
+    )
+
     python_name: str
-    default_resolver: Callable[[Any, str], object] = getattr
+    default_resolver: Callable[[Any, str], object]
 
     def __init__(
         self,
@@ -65,7 +140,7 @@ class StrawberryField(dataclasses.Field):
         description_sources: Optional[DescriptionSources] = None,
         description: Optional[str] = None,
         base_resolver: Optional[StrawberryResolver] = None,
-        permission_classes: List[Type[BasePermission]] = (),  # type: ignore
+        permission_classes: Sequence[Type[BasePermission]] = (),
         default: object = dataclasses.MISSING,
         default_factory: Union[Callable[[], Any], object] = dataclasses.MISSING,
         metadata: Optional[Mapping[Any, Any]] = None,
@@ -75,12 +150,6 @@ class StrawberryField(dataclasses.Field):
         # basic fields are fields with no provided resolver
         is_basic_field = not base_resolver
 
-        kwargs: Dict[str, Any] = {}
-
-        # kw_only was added to python 3.10 and it is required
-        if sys.version_info >= (3, 10):
-            kwargs["kw_only"] = dataclasses.MISSING
-
         super().__init__(
             default=default,
             default_factory=default_factory,  # type: ignore
@@ -88,10 +157,12 @@ class StrawberryField(dataclasses.Field):
             repr=is_basic_field,
             compare=is_basic_field,
             hash=None,
-            metadata=metadata or {},
-            **kwargs,
+            # dataclasses shares the same empty mapping for fields without metadata
+            metadata=metadata,  # type: ignore
+            **_FIELD_KWARGS,
         )
 
+        self.default_resolver = getattr
         self.graphql_name = graphql_name
         if python_name is not None:
             self.python_name = python_name
@@ -102,8 +173,13 @@ class StrawberryField(dataclasses.Field):
         self.description: Optional[str] = description
         self.origin = origin
 
+        # Computed on first access, since they depend on the field type
+        self._permission_classes: Optional[List[Type[BasePermission]]] = None
+        self._is_async: Optional[bool] = None
+        self._type_cache: Optional[Tuple[object, Any]] = None
+
         self._base_resolver: Optional[StrawberryResolver] = None
-        self.resolver_docstring: Optional[Docstring] = None
+        self._resolver_docstring: Optional[Docstring] = None
         if base_resolver is not None:
             self.base_resolver = base_resolver
 
@@ -111,30 +187,63 @@ class StrawberryField(dataclasses.Field):
         # StrawberryField.default_value except that `.default` uses
         # `dataclasses.MISSING` to represent an "undefined" value and
         # `.default_value` uses `UNSET`
-        self.default_value = default
+        self._default_value = default
         if callable(default_factory):
-            try:
-                self.default_value = default_factory()
-            except TypeError as exc:
-                raise InvalidDefaultFactoryError() from exc
+            # The factory is only called when the default value is needed, but
+            # invalid factories are still reported right away
+            _check_default_factory(default_factory)
+            self._default_value = _DEFAULT_FROM_FACTORY
 
         self.is_subscription = is_subscription
 
-        self.explicit_permission_classes: List[Type[BasePermission]] = list(
+        # `tuple` doesn't copy tuples, so the default doesn't allocate anything
+        self.explicit_permission_classes: Tuple[Type[BasePermission], ...] = tuple(
             permission_classes
         )
         self.directives = directives
 
         self.deprecation_reason = deprecation_reason
 
-    @cached_property
-    def permission_classes(self):
-        annotated_permissions = [
-            annotation
-            for annotation in StrawberryAnnotated.get_type_and_args(self.type)[1]
-            if inspect.isclass(annotation) and issubclass(annotation, BasePermission)
-        ]
-        return annotated_permissions + self.explicit_permission_classes
+    @property
+    def default_value(self) -> object:
+        default_value = self._default_value
+        if default_value is _DEFAULT_FROM_FACTORY:
+            try:
+                default_value = self.default_factory()  # type: ignore
+            except TypeError as exc:
+                raise InvalidDefaultFactoryError() from exc
+            self._default_value = default_value
+        return default_value
+
+    @default_value.setter
+    def default_value(self, value: object) -> None:
+        self._default_value = value
+
+    @property
+    def permission_classes(self) -> List[Type[BasePermission]]:
+        permission_classes = self._permission_classes
+        if permission_classes is None:
+            type_ = self.type
+
+            # Resolved annotations already carry all their (flattened) arguments
+            annotations: Sequence[Any]
+            if type(type_) is StrawberryAnnotated:
+                annotations = type_.args
+            else:
+                annotations = StrawberryAnnotated.get_type_and_args(type_)[1]
+
+            annotated_permissions = [
+                annotation
+                for annotation in annotations
+                if inspect.isclass(annotation)
+                and issubclass(annotation, BasePermission)
+            ]
+            permission_classes = [
+                *annotated_permissions,
+                *self.explicit_permission_classes,
+            ]
+            self._permission_classes = permission_classes
+        return permission_classes
 
     def __call__(self, resolver: _RESOLVER_TYPE) -> "StrawberryField":
         """Add a resolver to the field"""
@@ -173,10 +282,15 @@ class StrawberryField(dataclasses.Field):
         to using the default resolver specified in StrawberryConfig.
         """
 
+        # Basic fields are resolved without an `Info` (see `is_basic_field`), so
+        # there's no current info worth setting for them
+        if self.is_basic_field:
+            return self.default_resolver(source, self.python_name)
+
         old_info = current_info.set(info)
         try:
-            if self.base_resolver:
-                return self.base_resolver(*args, **kwargs)
+            if self._base_resolver is not None:
+                return self._base_resolver(*args, **kwargs)
 
             return self.default_resolver(source, self.python_name)
         finally:
@@ -191,7 +305,7 @@ class StrawberryField(dataclasses.Field):
         an `Info` object and running any permission checks in the resolver
         which improves performance.
         """
-        return not self.base_resolver and not self.permission_classes
+        return self._base_resolver is None and not self.permission_classes
 
     @property
     def arguments(self) -> List[StrawberryArgument]:
@@ -224,7 +338,10 @@ class StrawberryField(dataclasses.Field):
     @base_resolver.setter
     def base_resolver(self, resolver: StrawberryResolver) -> None:
         self._base_resolver = resolver
-        self.resolver_docstring = Docstring(resolver.wrapped_func)
+        self._permission_classes = None
+        self._is_async = None
+        self._type_cache = None
+        self._resolver_docstring = None
 
         # Don't add field to __init__, __repr__ and __eq__ once it has a resolver
         self.init = False
@@ -242,8 +359,20 @@ class StrawberryField(dataclasses.Field):
         #       removed.
         _ = resolver.arguments
 
-    @property  # type: ignore
-    def type(self) -> Union[StrawberryType, type, Literal[UNRESOLVED]]:  # type: ignore
+    @property
+    def resolver_docstring(self) -> Optional[Docstring]:
+        # The docstring is only needed when building descriptions for the schema
+        if self._resolver_docstring is None and self._base_resolver is not None:
+            self._resolver_docstring = Docstring(self._base_resolver.wrapped_func)
+        return self._resolver_docstring
+
+    @resolver_docstring.setter
+    def resolver_docstring(self, docstring: Optional[Docstring]) -> None:
+        self._resolver_docstring = docstring
+
+    def _resolve_type(
+        self,
+    ) -> Union[StrawberryType, type, Literal[UNRESOLVED]]:  # type: ignore
         # We are catching NameError because dataclasses tries to fetch the type
         # of the field from the class before the class is fully defined.
         # This triggers a NameError error when using forward references because
@@ -270,9 +399,24 @@ class StrawberryField(dataclasses.Field):
         except NameError:
             return UNRESOLVED
 
+    @property  # type: ignore
+    def type(self) -> Union[StrawberryType, type, Literal[UNRESOLVED]]:  # type: ignore
+        # The resolved type is cached together with the annotation it was resolved
+        # from, as `type_annotation` can be replaced directly (e.g. by `_get_fields`)
+        type_annotation = self.type_annotation
+        type_cache = self._type_cache
+        if type_cache is not None and type_cache[0] is type_annotation:
+            return type_cache[1]
+
+        type_ = self._resolve_type()
+        if type_ is not UNRESOLVED:
+            self._type_cache = (type_annotation, type_)
+        return type_
+
     @type.setter
     def type(self, type_: Any) -> None:
         self.type_annotation = type_
+        self._type_cache = None
 
     # TODO: add this to arguments (and/or move it to StrawberryType)
     @property
@@ -331,18 +475,25 @@ class StrawberryField(dataclasses.Field):
 
     @property
     def _has_async_permission_classes(self) -> bool:
-        for permission_class in self.permission_classes:
-            if inspect.iscoroutinefunction(permission_class.has_permission):
-                return True
-        return False
+        return any(
+            _is_async_permission_class(permission_class)
+            for permission_class in self.permission_classes
+        )
 
     @property
     def _has_async_base_resolver(self) -> bool:
-        return self.base_resolver is not None and self.base_resolver.is_async
+        base_resolver = self._base_resolver
+        return base_resolver is not None and base_resolver.is_async
 
-    @cached_property
+    @property
     def is_async(self) -> bool:
-        return self._has_async_permission_classes or self._has_async_base_resolver
+        is_async = self._is_async
+        if is_async is None:
+            is_async = (
+                self._has_async_permission_classes or self._has_async_base_resolver
+            )
+            self._is_async = is_async
+        return is_async
 
 
 @overload
@@ -440,7 +591,7 @@ def field(
         description_sources=description_sources,
         description=description,
         is_subscription=is_subscription,
-        permission_classes=permission_classes or [],
+        permission_classes=permission_classes or (),
         deprecation_reason=deprecation_reason,
         default=default,
         default_factory=default_factory,
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import inspect
 import sys
 import types
@@ -25,26 +26,32 @@ from .exceptions import (
 from .field import StrawberryField, field
 from .types.type_resolver import _get_fields
 from .types.types import TypeDefinition
-from .utils.dataclasses import add_custom_init_fn
 from .utils.docstrings import Docstring
 from .utils.str_converters import to_camel_case
 from .utils.typing import __dataclass_transform__
 
 
+# Python 3.10 introduces the kw_only param. If we're on an older version
+# then generate our own custom init function
+_DATACLASS_KWARGS: Dict[str, bool] = (
+    {"kw_only": True} if sys.version_info >= (3, 10) else {"init": False}
+)
+
+
 def _get_interfaces(cls: Type) -> List[TypeDefinition]:
     interfaces = []
 
-    for base in cls.__bases__:
+    # Every base class appears once in the MRO, so there's no need to recurse.
+    # Reading each class' own `__dict__` avoids picking up inherited
+    # definitions more than once
+    for base in cls.__mro__[1:]:
         type_definition = cast(
-            Optional[TypeDefinition], getattr(base, "_type_definition", None)
+            Optional[TypeDefinition], base.__dict__.get("_type_definition")
         )
 
         if type_definition and type_definition.is_interface:
             interfaces.append(type_definition)
 
-        for inherited_interface in _get_interfaces(base):
-            interfaces.append(inherited_interface)
-
     return interfaces
 
 
@@ -104,18 +111,11 @@ def _wrap_dataclass(cls: Type):
     # Ensure all Fields have been properly type-annotated
     _check_field_annotations(cls)
 
-    dclass_kwargs: Dict[str, bool] = {}
-
-    # Python 3.10 introduces the kw_only param. If we're on an older version
-    # then generate our own custom init function
-    if sys.version_info >= (3, 10):
-        dclass_kwargs["kw_only"] = True
-    else:
-        dclass_kwargs["init"] = False
-
-    dclass = dataclasses.dataclass(cls, **dclass_kwargs)
+    dclass = dataclasses.dataclass(cls, **_DATACLASS_KWARGS)
 
     if sys.version_info < (3, 10):
+        from .utils.dataclasses import add_custom_init_fn
+
         add_custom_init_fn(dclass)
 
     return dclass
@@ -178,6 +178,43 @@ def _process_type(
     return cls
 
 
+def _wrap_type(
+    cls,
+    *,
+    name: Optional[str] = None,
+    is_input: bool = False,
+    is_interface: bool = False,
+    description_sources: Optional[DescriptionSources] = None,
+    description: Optional[str] = None,
+    directives: Optional[Sequence[object]] = (),
+    extend: bool = False,
+):
+    """Turns a class into a strawberry type, shared by all the type decorators"""
+
+    if not inspect.isclass(cls):
+        if is_input:
+            exc = ObjectIsNotClassError.input
+        elif is_interface:
+            exc = ObjectIsNotClassError.interface
+        else:
+            exc = ObjectIsNotClassError.type
+        raise exc(cls)
+
+    docstring = Docstring(cls)
+    wrapped = _wrap_dataclass(cls)
+    return _process_type(
+        wrapped,
+        name=name,
+        is_input=is_input,
+        is_interface=is_interface,
+        description_sources=description_sources,
+        description=description,
+        docstring=docstring,
+        directives=directives,
+        extend=extend,
+    )
+
+
 T = TypeVar("T", bound=Type)
 
 
@@ -236,29 +273,16 @@ def type(
     >>>     field_abc: str = "ABC"
     """
 
-    def wrap(cls):
-        if not inspect.isclass(cls):
-            if is_input:
-                exc = ObjectIsNotClassError.input
-            elif is_interface:
-                exc = ObjectIsNotClassError.interface
-            else:
-                exc = ObjectIsNotClassError.type
-            raise exc(cls)
-
-        docstring = Docstring(cls)
-        wrapped = _wrap_dataclass(cls)
-        return _process_type(
-            wrapped,
-            name=name,
-            is_input=is_input,
-            is_interface=is_interface,
-            description_sources=description_sources,
-            description=description,
-            docstring=docstring,
-            directives=directives,
-            extend=extend,
-        )
+    wrap = functools.partial(
+        _wrap_type,
+        name=name,
+        is_input=is_input,
+        is_interface=is_interface,
+        description_sources=description_sources,
+        description=description,
+        directives=directives,
+        extend=extend,
+    )
 
     if cls is None:
         return wrap
@@ -308,15 +332,20 @@ def input(
     >>>     field_abc: str = "ABC"
     """
 
-    return type(  # type: ignore # not sure why mypy complains here
-        cls,
+    wrap = functools.partial(
+        _wrap_type,
         name=name,
+        is_input=True,
         description_sources=description_sources,
         description=description,
         directives=directives,
-        is_input=True,
     )
 
+    if cls is None:
+        return wrap
+
+    return wrap(cls)
+
 
 @overload
 @__dataclass_transform__(
@@ -363,15 +392,20 @@ def interface(
     >>>     field_abc: str
     """
 
-    return type(  # type: ignore # not sure why mypy complains here
-        cls,
+    wrap = functools.partial(
+        _wrap_type,
         name=name,
+        is_interface=True,
         description_sources=description_sources,
         description=description,
         directives=directives,
-        is_interface=True,
     )
 
+    if cls is None:
+        return wrap
+
+    return wrap(cls)
+
 
 __all__ = [
     "TypeDefinition",
@@ -1,4 +1,5 @@
-from typing import Any, Awaitable, Optional, Union
+import inspect
+from typing import Any, Awaitable, Callable, Optional, Tuple, Union
 
 from typing_extensions import Annotated
 
@@ -12,6 +13,15 @@ class BasePermission:
 
     message: Optional[str] = None
 
+    # Whether `has_permission` is a coroutine function, computed once per class. The
+    # function it was computed for is kept, in case `has_permission` is replaced
+    _is_async: Optional[Tuple[Callable[..., Any], bool]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        has_permission = cls.has_permission
+        cls._is_async = (has_permission, inspect.iscoroutinefunction(has_permission))
+
     @classmethod
     def __class_getitem__(cls, type_):
         return Annotated[type_, cls]
@@ -26,4 +26,7 @@ Example:
 
 def is_private(type_: Union[StrawberryType, type]) -> bool:
     _, args = StrawberryAnnotated.get_type_and_args(type_)
-    return any(isinstance(argument, StrawberryPrivate) for argument in args)
+    for argument in args:
+        if isinstance(argument, StrawberryPrivate):
+            return True
+    return False
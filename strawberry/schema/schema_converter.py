@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import sys
+from operator import attrgetter
 from typing import (
     Any,
     Callable,
     Dict,
     List,
+    NamedTuple,
     Optional,
     Tuple,
     Type,
@@ -16,6 +19,7 @@ from typing import (
 )
 
 from graphql import (
+    EnumValueNode,
     GraphQLArgument,
     GraphQLDirective,
     GraphQLEnumType,
@@ -39,7 +43,7 @@ from graphql import (
 from graphql.language.directive_locations import DirectiveLocation
 
 from strawberry.annotation import StrawberryAnnotation
-from strawberry.arguments import StrawberryArgument, convert_arguments
+from strawberry.arguments import StrawberryArgument, compile_arguments_converter
 from strawberry.custom_scalar import ScalarDefinition, ScalarWrapper
 from strawberry.description_sources import DescriptionSources
 from strawberry.directive import StrawberryDirective
@@ -68,10 +72,10 @@ from strawberry.union import StrawberryUnion
 from strawberry.unset import UNSET
 from strawberry.utils.await_maybe import await_maybe
 from strawberry.utils.docstrings import Docstring
-from strawberry.utils.pick import pick_not_none
+from strawberry.utils.identity_dict import IdentityDict
 
 from . import compat
-from .types.concrete_type import ConcreteType
+from .types.concrete_type import ConcreteType, GraphQLType
 
 
 # graphql-core expects a resolver for an Enum type to return
@@ -82,26 +86,107 @@ class CustomGraphQLEnumType(GraphQLEnumType):
     def __init__(self, enum: EnumDefinition, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.wrapped_cls = enum.wrapped_cls
+        # Direct lookups are much cheaper than going through `EnumMeta.__call__`.
+        # Only the GraphQL values are included, so Python aliases stay invalid
+        self._members_by_name: Dict[str, Any] = {
+            value.name: enum.wrapped_cls[value.name] for value in enum.values
+        }
+        self._names_by_member: Dict[Any, str] = {
+            member: name for name, member in self._members_by_name.items()
+        }
 
     def serialize(self, output_value: Any) -> str:
-        if isinstance(output_value, self.wrapped_cls):
-            return output_value.name
-        return super().serialize(output_value)
+        try:
+            return self._names_by_member[output_value]
+        except (KeyError, TypeError):
+            return super().serialize(output_value)
 
     def parse_value(self, input_value: str) -> Any:
+        if isinstance(input_value, str):
+            member = self._members_by_name.get(input_value)
+            if member is not None:
+                return member
         return self.wrapped_cls(super().parse_value(input_value))
 
     def parse_literal(
         self, value_node: ValueNode, _variables: Optional[Dict[str, Any]] = None
     ) -> Any:
+        if isinstance(value_node, EnumValueNode):
+            member = self._members_by_name.get(value_node.value)
+            if member is not None:
+                return member
         return self.wrapped_cls(super().parse_literal(value_node, _variables))
 
 
+# Same as `GraphQLCoreConverter.DEFINITION_BACKREF`, used by the converter to
+# avoid looking up the class attribute for every converted type
+DEFINITION_BACKREF = "strawberry-definition"
+
+
+def _resolve_subscription_event(event: Any, *_, **__) -> Any:
+    """Resolver of subscription fields, which just return each subscription event"""
+    return event
+
+
+def _is_type_of(
+    origin: Type, concrete_origin: Optional[Type], obj: Any, _info: GraphQLResolveInfo
+) -> bool:
+    """Default `is_type_of` for object types that implement interfaces"""
+    if concrete_origin is not None:
+        type_definition = getattr(obj, "_type_definition", None)
+        if type_definition is not None and type_definition.origin is concrete_origin:
+            return True
+
+    return isinstance(obj, origin)
+
+
+class _EnabledDescriptionSources(NamedTuple):
+    """Description sources, in the order they are looked at by `_get_description`"""
+
+    strawberry_descriptions: bool
+    resolver_docstrings: bool
+    type_attribute_docstrings: bool
+    type_docstrings: bool
+    enum_attribute_docstrings: bool
+    enum_docstrings: bool
+    directive_attribute_docstrings: bool
+    directive_docstrings: bool
+
+
+@functools.lru_cache(maxsize=None)
+def _get_enabled_description_sources(
+    sources: DescriptionSources,
+) -> _EnabledDescriptionSources:
+    """Which description sources are enabled in `sources`
+
+    Operations on `Flag` are implemented in Python and rather slow, and there are only
+    a few distinct `sources` per schema, so precompute these once.
+    """
+    return _EnabledDescriptionSources(
+        strawberry_descriptions=bool(
+            sources & DescriptionSources.STRAWBERRY_DESCRIPTIONS
+        ),
+        resolver_docstrings=bool(sources & DescriptionSources.RESOLVER_DOCSTRINGS),
+        type_attribute_docstrings=bool(
+            sources & DescriptionSources.TYPE_ATTRIBUTE_DOCSTRINGS
+        ),
+        type_docstrings=bool(sources & DescriptionSources.TYPE_DOCSTRINGS),
+        enum_attribute_docstrings=bool(
+            sources & DescriptionSources.ENUM_ATTRIBUTE_DOCSTRINGS
+        ),
+        enum_docstrings=bool(sources & DescriptionSources.ENUM_DOCSTRINGS),
+        directive_attribute_docstrings=bool(
+            sources & DescriptionSources.DIRECTIVE_ATTRIBUTE_DOCSTRINGS
+        ),
+        directive_docstrings=bool(sources & DescriptionSources.DIRECTIVE_DOCSTRINGS),
+    )
+
+
 class GraphQLCoreConverter:
     # TODO: Make abstract
 
     # Extension key used to link a GraphQLType back into the Strawberry definition
-    DEFINITION_BACKREF = "strawberry-definition"
+    DEFINITION_BACKREF = DEFINITION_BACKREF
 
     def __init__(
         self,
@@ -112,6 +197,58 @@ class GraphQLCoreConverter:
         self.config = config
         self.scalar_registry = scalar_registry
 
+        # Converted types, keyed by the strawberry type
+        self._from_type_cache: IdentityDict[
+            object, GraphQLNullableType
+        ] = IdentityDict()
+        self._from_maybe_optional_cache: IdentityDict[
+            object, Union[GraphQLNullableType, GraphQLNonNull]
+        ] = IdentityDict()
+
+        # Same as `type_map`, but keyed by the definitions
+        self._type_map_by_id: IdentityDict[object, ConcreteType] = IdentityDict()
+
+        self._schema_directives: Dict[type, GraphQLDirective] = {}
+
+        # GraphQL names of the converted types, keyed by their definition
+        self._type_names: IdentityDict[object, str] = IdentityDict()
+
+        # Argument converters of the input types, shared by all the resolvers
+        self._input_converters: Dict[type, Callable[..., object]] = {}
+
+        # Converters for strawberry types that can be recognized by their class
+        self._from_type_dispatch: Dict[type, Callable[[Any], GraphQLNullableType]] = {
+            EnumDefinition: self.from_enum,
+            StrawberryList: self.from_list,
+            TypeDefinition: self.from_object,
+            StrawberryUnion: self.from_union,
+            LazyType: self._from_lazy_type,
+        }
+
+    def _add_concrete_type(
+        self,
+        name: str,
+        definition: Union[
+            TypeDefinition, EnumDefinition, ScalarDefinition, StrawberryUnion
+        ],
+        implementation: GraphQLType,
+    ) -> None:
+        concrete_type = ConcreteType(
+            definition=definition, implementation=implementation
+        )
+        self.type_map[name] = concrete_type
+        self._type_map_by_id[definition] = concrete_type
+
+    def _get_type_name(self, type_: Any) -> str:
+        # Definitions are named every time they're referenced
+        name = self._type_names.get(type_)
+
+        if name is None:
+            name = self.config.name_converter.from_type(type_)
+            self._type_names[type_] = name
+
+        return name
+
     def from_argument(
         self,
         argument: StrawberryArgument,
@@ -123,9 +260,10 @@ class GraphQLCoreConverter:
         argument_type = cast(GraphQLInputType, self.from_maybe_optional(argument.type))
         default_value = Undefined if argument.default is UNSET else argument.default
 
-        description_sources = pick_not_none(
-            argument.description_sources,
-            description_sources,
+        description_sources = (
+            argument.description_sources
+            if argument.description_sources is not None
+            else description_sources
         )
         description = self._get_description(
             sources=description_sources,
@@ -141,24 +279,27 @@ class GraphQLCoreConverter:
             description=description,
             deprecation_reason=argument.deprecation_reason,
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: argument,
+                DEFINITION_BACKREF: argument,
             },
         )
 
     def from_enum(self, enum: EnumDefinition) -> CustomGraphQLEnumType:
-        enum_name = self.config.name_converter.from_type(enum)
-
-        assert enum_name is not None
-
         # Don't reevaluate known types
-        if enum_name in self.type_map:
-            graphql_enum = self.type_map[enum_name].implementation
+        concrete_type = self._type_map_by_id.get(enum)
+        if concrete_type is None:
+            enum_name = self._get_type_name(enum)
+            assert enum_name is not None
+            concrete_type = self.type_map.get(enum_name)
+
+        if concrete_type is not None:
+            graphql_enum = concrete_type.implementation
             assert isinstance(graphql_enum, CustomGraphQLEnumType)  # For mypy
             return graphql_enum
 
-        description_sources = pick_not_none(
-            enum.description_sources,
-            self.config.description_sources,
+        description_sources = (
+            enum.description_sources
+            if enum.description_sources is not None
+            else self.config.description_sources
         )
         description = self._get_description(
             sources=description_sources,
@@ -166,6 +307,8 @@ class GraphQLCoreConverter:
             enum_docstring=enum.docstring,
         )
 
+        # The values are converted for each schema, like every other graphql-core
+        # object, because they are mutable (e.g. their `extensions`)
         graphql_enum = CustomGraphQLEnumType(
             enum=enum,
             name=enum_name,
@@ -177,13 +320,11 @@ class GraphQLCoreConverter:
             },
             description=description,
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: enum,
+                DEFINITION_BACKREF: enum,
             },
         )
 
-        self.type_map[enum_name] = ConcreteType(
-            definition=enum, implementation=graphql_enum
-        )
+        self._add_concrete_type(enum_name, enum, graphql_enum)
 
         return graphql_enum
 
@@ -193,9 +334,10 @@ class GraphQLCoreConverter:
         parent_enum_docstring: Optional[Docstring],
         description_sources: DescriptionSources,
     ) -> GraphQLEnumValue:
-        description_sources = pick_not_none(
-            enum_value.description_sources,
-            description_sources,
+        description_sources = (
+            enum_value.description_sources
+            if enum_value.description_sources is not None
+            else description_sources
         )
 
         description = self._get_description(
@@ -210,14 +352,15 @@ class GraphQLCoreConverter:
             deprecation_reason=enum_value.deprecation_reason,
             description=description,
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: enum_value,
+                DEFINITION_BACKREF: enum_value,
             },
         )
 
     def from_directive(self, directive: StrawberryDirective) -> GraphQLDirective:
-        description_sources = pick_not_none(
-            directive.description_sources,
-            self.config.description_sources,
+        description_sources = (
+            directive.description_sources
+            if directive.description_sources is not None
+            else self.config.description_sources
         )
         description = self._get_description(
             sources=description_sources,
@@ -243,19 +386,35 @@ class GraphQLCoreConverter:
             args=graphql_arguments,
             description=description,
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: directive,
+                DEFINITION_BACKREF: directive,
             },
         )
 
     def from_schema_directive(self, cls: Type) -> GraphQLDirective:
+        # Schema directives are converted again every time one of their usages is
+        # printed, so we only build each of them once
+        if not isinstance(cls, type):
+            # Directive instances convert the same as their class
+            cls = type(cls)
+
+        graphql_directive = self._schema_directives.get(cls)
+
+        if graphql_directive is None:
+            graphql_directive = self._from_schema_directive(cls)
+            self._schema_directives[cls] = graphql_directive
+
+        return graphql_directive
+
+    def _from_schema_directive(self, cls: Type) -> GraphQLDirective:
         strawberry_directive = cast(
             StrawberrySchemaDirective, cls.__strawberry_directive__
         )
         module = sys.modules[cls.__module__]
 
-        description_sources = pick_not_none(
-            strawberry_directive.description_sources,
-            self.config.description_sources,
+        description_sources = (
+            strawberry_directive.description_sources
+            if strawberry_directive.description_sources is not None
+            else self.config.description_sources
         )
         description = self._get_description(
             sources=description_sources,
@@ -295,7 +454,7 @@ class GraphQLCoreConverter:
             is_repeatable=strawberry_directive.repeatable,
             description=description,
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: strawberry_directive,
+                DEFINITION_BACKREF: strawberry_directive,
             },
         )
 
@@ -312,15 +471,22 @@ class GraphQLCoreConverter:
 
         if field.is_subscription:
             subscribe = resolver
-            resolver = lambda event, *_, **__: event  # noqa: E731
+            resolver = _resolve_subscription_event
 
-        description_sources = pick_not_none(
-            field.description_sources, description_sources
+        description_sources = (
+            field.description_sources
+            if field.description_sources is not None
+            else description_sources
+        )
+        # Only look at the resolver docstring if it can be used for descriptions
+        enabled_sources = _get_enabled_description_sources(description_sources)
+        resolver_docstring = (
+            field.resolver_docstring if enabled_sources.resolver_docstrings else None
         )
         description = self._get_description(
             sources=description_sources,
             description=field.description,
-            resolver_docstring=field.resolver_docstring,
+            resolver_docstring=resolver_docstring,
             parent_type_docstring=parent_type_docstring,
             child_name=field.python_name,
         )
@@ -342,7 +508,7 @@ class GraphQLCoreConverter:
             description=description,
             deprecation_reason=field.deprecation_reason,
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: field,
+                DEFINITION_BACKREF: field,
             },
         )
 
@@ -360,9 +526,10 @@ class GraphQLCoreConverter:
         else:
             default_value = field.default_value
 
-        description_sources = pick_not_none(
-            field.description_sources,
-            description_sources,
+        description_sources = (
+            field.description_sources
+            if field.description_sources is not None
+            else description_sources
         )
         description = self._get_description(
             sources=description_sources,
@@ -378,7 +545,7 @@ class GraphQLCoreConverter:
             description=description,
             deprecation_reason=field.deprecation_reason,
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: field,
+                DEFINITION_BACKREF: field,
             },
         )
 
@@ -448,17 +615,21 @@ class GraphQLCoreConverter:
     def from_input_object(self, object_type: type) -> GraphQLInputObjectType:
         type_definition = object_type._type_definition  # type: ignore
 
-        type_name = self.config.name_converter.from_type(type_definition)
-
         # Don't reevaluate known types
-        if type_name in self.type_map:
-            graphql_object_type = self.type_map[type_name].implementation
+        concrete_type = self._type_map_by_id.get(type_definition)
+        if concrete_type is None:
+            type_name = self._get_type_name(type_definition)
+            concrete_type = self.type_map.get(type_name)
+
+        if concrete_type is not None:
+            graphql_object_type = concrete_type.implementation
             assert isinstance(graphql_object_type, GraphQLInputObjectType)  # For mypy
             return graphql_object_type
 
-        description_sources = pick_not_none(
-            type_definition.description_sources,
-            self.config.description_sources,
+        description_sources = (
+            type_definition.description_sources
+            if type_definition.description_sources is not None
+            else self.config.description_sources
         )
         description = self._get_description(
             sources=description_sources,
@@ -473,30 +644,32 @@ class GraphQLCoreConverter:
             ),
             description=description,
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: type_definition,
+                DEFINITION_BACKREF: type_definition,
             },
         )
 
-        self.type_map[type_name] = ConcreteType(
-            definition=type_definition, implementation=graphql_object_type
-        )
+        self._add_concrete_type(type_name, type_definition, graphql_object_type)
 
         return graphql_object_type
 
     def from_interface(self, interface: TypeDefinition) -> GraphQLInterfaceType:
         # TODO: Use StrawberryInterface when it's implemented in another PR
 
-        interface_name = self.config.name_converter.from_type(interface)
-
         # Don't reevaluate known types
-        if interface_name in self.type_map:
-            graphql_interface = self.type_map[interface_name].implementation
+        concrete_type = self._type_map_by_id.get(interface)
+        if concrete_type is None:
+            interface_name = self._get_type_name(interface)
+            concrete_type = self.type_map.get(interface_name)
+
+        if concrete_type is not None:
+            graphql_interface = concrete_type.implementation
             assert isinstance(graphql_interface, GraphQLInterfaceType)  # For mypy
             return graphql_interface
 
-        description_sources = pick_not_none(
-            interface.description_sources,
-            self.config.description_sources,
+        description_sources = (
+            interface.description_sources
+            if interface.description_sources is not None
+            else self.config.description_sources
         )
         description = self._get_description(
             sources=description_sources,
@@ -509,16 +682,14 @@ class GraphQLCoreConverter:
             fields=lambda: self.get_graphql_fields(
                 interface, description_sources, interface.docstring
             ),
-            interfaces=list(map(self.from_interface, interface.interfaces)),
+            interfaces=tuple(map(self.from_interface, interface.interfaces)),
             description=description,
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: interface,
+                DEFINITION_BACKREF: interface,
             },
         )
 
-        self.type_map[interface_name] = ConcreteType(
-            definition=interface, implementation=graphql_interface
-        )
+        self._add_concrete_type(interface_name, interface, graphql_interface)
 
         return graphql_interface
 
@@ -529,17 +700,22 @@ class GraphQLCoreConverter:
 
     def from_object(self, object_type: TypeDefinition) -> GraphQLObjectType:
         # TODO: Use StrawberryObjectType when it's implemented in another PR
-        object_type_name = self.config.name_converter.from_type(object_type)
 
         # Don't reevaluate known types
-        if object_type_name in self.type_map:
-            graphql_object_type = self.type_map[object_type_name].implementation
+        concrete_type = self._type_map_by_id.get(object_type)
+        if concrete_type is None:
+            object_type_name = self._get_type_name(object_type)
+            concrete_type = self.type_map.get(object_type_name)
+
+        if concrete_type is not None:
+            graphql_object_type = concrete_type.implementation
             assert isinstance(graphql_object_type, GraphQLObjectType)  # For mypy
             return graphql_object_type
 
-        description_sources = pick_not_none(
-            object_type.description_sources,
-            self.config.description_sources,
+        description_sources = (
+            object_type.description_sources
+            if object_type.description_sources is not None
+            else self.config.description_sources
         )
         description = self._get_description(
             sources=description_sources,
@@ -554,33 +730,27 @@ class GraphQLCoreConverter:
             if not object_type.interfaces:
                 return None
 
-            def is_type_of(obj: Any, _info: GraphQLResolveInfo) -> bool:
-                if object_type.concrete_of and (
-                    hasattr(obj, "_type_definition")
-                    and obj._type_definition.origin is object_type.concrete_of.origin
-                ):
-                    return True
-
-                return isinstance(obj, object_type.origin)
-
-            return is_type_of
+            concrete_of = object_type.concrete_of
+            return functools.partial(
+                _is_type_of,
+                object_type.origin,
+                concrete_of.origin if concrete_of else None,
+            )
 
         graphql_object_type = GraphQLObjectType(
             name=object_type_name,
             fields=lambda: self.get_graphql_fields(
                 object_type, description_sources, object_type.docstring
             ),
-            interfaces=list(map(self.from_interface, object_type.interfaces)),
+            interfaces=tuple(map(self.from_interface, object_type.interfaces)),
             description=description,
             is_type_of=_get_is_type_of(),
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: object_type,
+                DEFINITION_BACKREF: object_type,
             },
         )
 
-        self.type_map[object_type_name] = ConcreteType(
-            definition=object_type, implementation=graphql_object_type
-        )
+        self._add_concrete_type(object_type_name, object_type, graphql_object_type)
 
         return graphql_object_type
 
@@ -590,27 +760,66 @@ class GraphQLCoreConverter:
         field.default_resolver = self.config.default_resolver
 
         if field.is_basic_field:
+            if type(field).get_result is StrawberryField.get_result:
+                # `get_result` hasn't been customized, so we can skip it and
+                # call the default resolver directly
+                default_resolver = self.config.default_resolver
+                python_name = field.python_name
+
+                if default_resolver is getattr:
+                    get_attribute = attrgetter(python_name)
+
+                    def _get_basic_result(_source: Any, *args, **kwargs):
+                        return get_attribute(_source)
+
+                else:
+
+                    def _get_basic_result(_source: Any, *args, **kwargs):
+                        return default_resolver(_source, python_name)
+
+            else:
 
-            def _get_basic_result(_source: Any, *args, **kwargs):
-                # Call `get_result` without an info object or any args or
-                # kwargs because this is a basic field with no resolver.
-                return field.get_result(_source, info=None, args=[], kwargs={})
+                def _get_basic_result(_source: Any, *args, **kwargs):
+                    # Call `get_result` without an info object or any args or
+                    # kwargs because this is a basic field with no resolver.
+                    return field.get_result(_source, info=None, args=[], kwargs={})
 
             _get_basic_result._is_default = True  # type: ignore
 
             return _get_basic_result
 
+        # Inspect the resolver signature once, instead of on every call
+        uses_self = False
+        root_name: Optional[str] = None
+        info_name: Optional[str] = None
+
+        base_resolver = field.base_resolver
+        if base_resolver:
+            uses_self = base_resolver.self_parameter is not None
+            root_parameter = base_resolver.root_parameter
+            if root_parameter:
+                root_name = root_parameter.name
+            info_parameter = base_resolver.info_parameter
+            if info_parameter:
+                info_name = info_parameter.name
+
+        convert_kwargs = (
+            compile_arguments_converter(
+                field.arguments,
+                scalar_registry=self.scalar_registry,
+                config=self.config,
+                input_converters=self._input_converters,
+            )
+            if field.arguments
+            else None
+        )
+
         def _get_arguments(
             source: Any,
             info: Info,
             kwargs: Dict[str, Any],
         ) -> Tuple[List[Any], Dict[str, Any]]:
-            kwargs = convert_arguments(
-                kwargs,
-                field.arguments,
-                scalar_registry=self.scalar_registry,
-                config=self.config,
-            )
+            kwargs = convert_kwargs(kwargs) if convert_kwargs is not None else {}
 
             # the following code allows to omit info and root arguments
             # by inspecting the original resolver arguments,
@@ -620,26 +829,25 @@ class GraphQLCoreConverter:
 
             args = []
 
-            if field.base_resolver:
-                if field.base_resolver.self_parameter:
-                    args.append(source)
+            if uses_self:
+                args.append(source)
 
-                root_parameter = field.base_resolver.root_parameter
-                if root_parameter:
-                    kwargs[root_parameter.name] = source
+            if root_name is not None:
+                kwargs[root_name] = source
 
-                info_parameter = field.base_resolver.info_parameter
-                if info_parameter:
-                    kwargs[info_parameter.name] = info
+            if info_name is not None:
+                kwargs[info_name] = info
 
             return args, kwargs
 
+        permission_classes = tuple(field.permission_classes)
+
         def _check_permissions(source: Any, info: Info, kwargs: Dict[str, Any]):
             """
             Checks if the permission should be accepted and
             raises an exception if not
             """
-            for permission_class in field.permission_classes:
+            for permission_class in permission_classes:
                 permission = permission_class()
 
                 if not permission.has_permission(source, info, **kwargs):
@@ -649,7 +857,7 @@ class GraphQLCoreConverter:
         async def _check_permissions_async(
             source: Any, info: Info, kwargs: Dict[str, Any]
         ):
-            for permission_class in field.permission_classes:
+            for permission_class in permission_classes:
                 permission = permission_class()
                 has_permission: bool
 
@@ -662,10 +870,9 @@ class GraphQLCoreConverter:
                     raise PermissionError(message)
 
         def _strawberry_info_from_graphql(info: GraphQLResolveInfo) -> Info:
-            return Info(
-                _raw_info=info,
-                _field=field,
-            )
+            # Positional arguments are noticeably cheaper than keywords here, and
+            # this runs once per resolved field
+            return Info(info, field)
 
         def _get_result(_source: Any, info: Info, **kwargs):
             field_args, field_kwargs = _get_arguments(
@@ -676,24 +883,52 @@ class GraphQLCoreConverter:
                 _source, info=info, args=field_args, kwargs=field_kwargs
             )
 
-        def _resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
-            strawberry_info = _strawberry_info_from_graphql(info)
-            _check_permissions(_source, strawberry_info, kwargs)
+        # Pick the resolver once, so that fields without permission classes don't
+        # pay for the permission checks on every call
+        if field.is_async:
+            if permission_classes:
 
-            return _get_result(_source, strawberry_info, **kwargs)
+                async def _async_resolver(
+                    _source: Any, info: GraphQLResolveInfo, **kwargs
+                ):
+                    strawberry_info = _strawberry_info_from_graphql(info)
+                    await _check_permissions_async(_source, strawberry_info, kwargs)
 
-        async def _async_resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
-            strawberry_info = _strawberry_info_from_graphql(info)
-            await _check_permissions_async(_source, strawberry_info, kwargs)
+                    return await await_maybe(
+                        _get_result(_source, strawberry_info, **kwargs)
+                    )
 
-            return await await_maybe(_get_result(_source, strawberry_info, **kwargs))
+            else:
+
+                async def _async_resolver(
+                    _source: Any, info: GraphQLResolveInfo, **kwargs
+                ):
+                    strawberry_info = _strawberry_info_from_graphql(info)
+
+                    return await await_maybe(
+                        _get_result(_source, strawberry_info, **kwargs)
+                    )
 
-        if field.is_async:
             _async_resolver._is_default = not field.base_resolver  # type: ignore
             return _async_resolver
+
+        if permission_classes:
+
+            def _resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
+                strawberry_info = _strawberry_info_from_graphql(info)
+                _check_permissions(_source, strawberry_info, kwargs)
+
+                return _get_result(_source, strawberry_info, **kwargs)
+
         else:
-            _resolver._is_default = not field.base_resolver  # type: ignore
-            return _resolver
+
+            def _resolver(_source: Any, info: GraphQLResolveInfo, **kwargs):
+                strawberry_info = _strawberry_info_from_graphql(info)
+
+                return _get_result(_source, strawberry_info, **kwargs)
+
+        _resolver._is_default = not field.base_resolver  # type: ignore
+        return _resolver
 
     def from_scalar(self, scalar: Type) -> GraphQLScalarType:
         scalar_definition: ScalarDefinition
@@ -708,7 +943,12 @@ class GraphQLCoreConverter:
         else:
             scalar_definition = scalar._scalar_definition
 
-        scalar_name = self.config.name_converter.from_type(scalar_definition)
+        # Don't reevaluate known scalars
+        concrete_type = self._type_map_by_id.get(scalar_definition)
+        if concrete_type is not None:
+            return cast(GraphQLScalarType, concrete_type.implementation)
+
+        scalar_name = self._get_type_name(scalar_definition)
 
         if scalar_name not in self.type_map:
             implementation = (
@@ -717,9 +957,7 @@ class GraphQLCoreConverter:
                 else _make_scalar_type(scalar_definition)
             )
 
-            self.type_map[scalar_name] = ConcreteType(
-                definition=scalar_definition, implementation=implementation
-            )
+            self._add_concrete_type(scalar_name, scalar_definition, implementation)
         else:
             if self.type_map[scalar_name].definition != scalar_definition:
                 raise ScalarAlreadyRegisteredError(scalar_name)
@@ -732,57 +970,92 @@ class GraphQLCoreConverter:
 
     def from_maybe_optional(
         self, type_: Union[StrawberryType, type]
+    ) -> Union[GraphQLNullableType, GraphQLNonNull]:
+        cached = self._from_maybe_optional_cache.get(type_)
+        if cached is not None:
+            return cached
+
+        graphql_type = self._from_maybe_optional(type_)
+        self._from_maybe_optional_cache[type_] = graphql_type
+        return graphql_type
+
+    def _from_maybe_optional(
+        self, type_: Union[StrawberryType, type]
     ) -> Union[GraphQLNullableType, GraphQLNonNull]:
         NoneType = type(None)
         type_, _ = StrawberryAnnotated.get_type_and_args(type_)
 
         if type_ is None or type_ is NoneType:
-            return self.from_type(type_)
+            return self._from_unwrapped_type(type_)
         elif isinstance(type_, StrawberryOptional):
             return self.from_type(type_.of_type)
         else:
-            return GraphQLNonNull(self.from_type(type_))
+            return GraphQLNonNull(self._from_unwrapped_type(type_))
 
     def from_type(self, type_: Union[StrawberryType, type]) -> GraphQLNullableType:
         type_, _ = StrawberryAnnotated.get_type_and_args(type_)
+        return self._from_unwrapped_type(type_)
 
+    def _from_unwrapped_type(
+        self, type_: Union[StrawberryType, type]
+    ) -> GraphQLNullableType:
+        """Same as `from_type`, for types that have already been unwrapped from
+        their annotations"""
+        cached = self._from_type_cache.get(type_)
+        if cached is not None:
+            return cached
+
+        graphql_type = self._from_type(type_)
+        self._from_type_cache[type_] = graphql_type
+        return graphql_type
+
+    def _from_type(self, type_: Union[StrawberryType, type]) -> GraphQLNullableType:
         if compat.is_generic(type_):
             raise MissingTypesForGenericError(type_)
 
-        if isinstance(type_, EnumDefinition):  # TODO: Replace with StrawberryEnum
-            return self.from_enum(type_)
-        elif compat.is_input_type(type_):  # TODO: Replace with StrawberryInputObject
-            return self.from_input_object(type_)
-        elif isinstance(type_, StrawberryList):
-            return self.from_list(type_)
-        elif compat.is_interface_type(type_):  # TODO: Replace with StrawberryInterface
-            type_definition: TypeDefinition = type_._type_definition  # type: ignore
-            return self.from_interface(type_definition)
-        elif compat.is_object_type(type_):  # TODO: Replace with StrawberryObject
-            type_definition: TypeDefinition = type_._type_definition  # type: ignore
+        handler = self._from_type_dispatch.get(type(type_))
+        if handler is not None:
+            return handler(type_)
+
+        # TODO: Replace with StrawberryInputObject, StrawberryInterface and
+        # StrawberryObject
+        type_definition: Optional[TypeDefinition] = getattr(
+            type_, "_type_definition", None
+        )
+        if type_definition is not None:
+            if type_definition.is_input:
+                return self.from_input_object(type_)  # type: ignore
+            if type_definition.is_interface:
+                return self.from_interface(type_definition)
             return self.from_object(type_definition)
-        elif compat.is_enum(type_):  # TODO: Replace with StrawberryEnum
+
+        if compat.is_enum(type_):  # TODO: Replace with StrawberryEnum
             enum_definition: EnumDefinition = type_._enum_definition  # type: ignore
             return self.from_enum(enum_definition)
-        elif isinstance(type_, TypeDefinition):  # TODO: Replace with StrawberryObject
-            return self.from_object(type_)
-        elif isinstance(type_, StrawberryUnion):
-            return self.from_union(type_)
-        elif isinstance(type_, LazyType):
-            return self.from_type(type_.resolve_type())
         elif compat.is_scalar(
             type_, self.scalar_registry
         ):  # TODO: Replace with StrawberryScalar
             return self.from_scalar(type_)
 
+        # Subclasses of the strawberry types aren't found by their exact class
+        for type_class, handler in self._from_type_dispatch.items():
+            if isinstance(type_, type_class):
+                return handler(type_)
+
         raise TypeError(f"Unexpected type '{type_}'")
 
-    def from_union(self, union: StrawberryUnion) -> GraphQLUnionType:
-        union_name = self.config.name_converter.from_type(union)
+    def _from_lazy_type(self, type_: LazyType) -> GraphQLNullableType:
+        return self.from_type(type_.resolve_type())
 
+    def from_union(self, union: StrawberryUnion) -> GraphQLUnionType:
         # Don't reevaluate known types
-        if union_name in self.type_map:
-            graphql_union = self.type_map[union_name].implementation
+        concrete_type = self._type_map_by_id.get(union)
+        if concrete_type is None:
+            union_name = self._get_type_name(union)
+            concrete_type = self.type_map.get(union_name)
+
+        if concrete_type is not None:
+            graphql_union = concrete_type.implementation
             assert isinstance(graphql_union, GraphQLUnionType)  # For mypy
             return graphql_union
 
@@ -802,13 +1075,11 @@ class GraphQLCoreConverter:
             description=union.description,
             resolve_type=union.get_type_resolver(self.type_map),
             extensions={
-                GraphQLCoreConverter.DEFINITION_BACKREF: union,
+                DEFINITION_BACKREF: union,
             },
         )
 
-        self.type_map[union_name] = ConcreteType(
-            definition=union, implementation=graphql_union
-        )
+        self._add_concrete_type(union_name, union, graphql_union)
 
         return graphql_union
 
@@ -827,49 +1098,82 @@ class GraphQLCoreConverter:
         parent_directive_docstring: Optional[Docstring] = None,
         child_name: Optional[str] = None,
     ) -> Optional[str]:
-        def gen_candidates():
-            if sources & DescriptionSources.STRAWBERRY_DESCRIPTIONS:
-                yield description
-
-            if sources & DescriptionSources.RESOLVER_DOCSTRINGS:
-                if resolver_docstring is not None:
-                    yield resolver_docstring.main_description
-                if parent_resolver_docstring is not None and child_name is not None:
-                    yield parent_resolver_docstring.child_description(child_name)
-
-            if sources & DescriptionSources.TYPE_ATTRIBUTE_DOCSTRINGS:
-                if parent_type_docstring is not None and child_name is not None:
-                    yield parent_type_docstring.attribute_docstring(child_name)
-
-            if sources & DescriptionSources.TYPE_DOCSTRINGS:
-                if type_docstring is not None:
-                    yield type_docstring.main_description
-
-                if parent_type_docstring is not None and child_name is not None:
-                    yield parent_type_docstring.child_description(child_name)
-
-            if sources & DescriptionSources.ENUM_ATTRIBUTE_DOCSTRINGS:
-                if parent_enum_docstring is not None and child_name is not None:
-                    yield parent_enum_docstring.attribute_docstring(child_name)
-
-            if sources & DescriptionSources.ENUM_DOCSTRINGS:
-                if enum_docstring:
-                    yield enum_docstring.main_description
-                if parent_enum_docstring is not None and child_name is not None:
-                    yield parent_enum_docstring.child_description(child_name)
-
-            if sources & DescriptionSources.DIRECTIVE_ATTRIBUTE_DOCSTRINGS:
-                if parent_directive_docstring is not None and child_name is not None:
-                    yield parent_directive_docstring.attribute_docstring(child_name)
-
-            if sources & DescriptionSources.DIRECTIVE_DOCSTRINGS:
-                if directive_docstring is not None:
-                    yield directive_docstring.main_description
-                if parent_directive_docstring is not None and child_name is not None:
-                    yield parent_directive_docstring.child_description(child_name)
-
-        for candidate in gen_candidates():
-            if candidate is not None:
-                return candidate
+        # By default only the explicit descriptions are used, so there's no need to
+        # look at any docstrings
+        if sources is DescriptionSources.STRAWBERRY_DESCRIPTIONS:
+            return description
+
+        (
+            use_descriptions,
+            use_resolver_docstrings,
+            use_type_attribute_docstrings,
+            use_type_docstrings,
+            use_enum_attribute_docstrings,
+            use_enum_docstrings,
+            use_directive_attribute_docstrings,
+            use_directive_docstrings,
+        ) = _get_enabled_description_sources(sources)
+
+        if use_descriptions and description is not None:
+            return description
+
+        if use_resolver_docstrings:
+            if resolver_docstring is not None:
+                candidate = resolver_docstring.main_description
+                if candidate is not None:
+                    return candidate
+            if parent_resolver_docstring is not None and child_name is not None:
+                candidate = parent_resolver_docstring.child_description(child_name)
+                if candidate is not None:
+                    return candidate
+
+        if use_type_attribute_docstrings:
+            if parent_type_docstring is not None and child_name is not None:
+                candidate = parent_type_docstring.attribute_docstring(child_name)
+                if candidate is not None:
+                    return candidate
+
+        if use_type_docstrings:
+            if type_docstring is not None:
+                candidate = type_docstring.main_description
+                if candidate is not None:
+                    return candidate
+
+            if parent_type_docstring is not None and child_name is not None:
+                candidate = parent_type_docstring.child_description(child_name)
+                if candidate is not None:
+                    return candidate
+
+        if use_enum_attribute_docstrings:
+            if parent_enum_docstring is not None and child_name is not None:
+                candidate = parent_enum_docstring.attribute_docstring(child_name)
+                if candidate is not None:
+                    return candidate
+
+        if use_enum_docstrings:
+            if enum_docstring:
+                candidate = enum_docstring.main_description
+                if candidate is not None:
+                    return candidate
+            if parent_enum_docstring is not None and child_name is not None:
+                candidate = parent_enum_docstring.child_description(child_name)
+                if candidate is not None:
+                    return candidate
+
+        if use_directive_attribute_docstrings:
+            if parent_directive_docstring is not None and child_name is not None:
+                candidate = parent_directive_docstring.attribute_docstring(child_name)
+                if candidate is not None:
+                    return candidate
+
+        if use_directive_docstrings:
+            if directive_docstring is not None:
+                candidate = directive_docstring.main_description
+                if candidate is not None:
+                    return candidate
+            if parent_directive_docstring is not None and child_name is not None:
+                candidate = parent_directive_docstring.child_description(child_name)
+                if candidate is not None:
+                    return candidate
 
         return None
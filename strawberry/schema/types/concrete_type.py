@@ -14,6 +14,8 @@ Field = Union[GraphQLInputField, GraphQLField]
 
 @dataclasses.dataclass
 class ConcreteType:
+    __slots__ = ("definition", "implementation")
+
     definition: Union[TypeDefinition, EnumDefinition, ScalarDefinition, StrawberryUnion]
     implementation: GraphQLType
 
@@ -1,6 +1,7 @@
 import dataclasses
+import sys
 from enum import Enum
-from typing import List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from strawberry.description_sources import DescriptionSources
 from strawberry.object_type import _wrap_dataclass
@@ -26,11 +27,17 @@ class Location(Enum):
     INPUT_FIELD_DEFINITION = "input field definition"
 
 
-@dataclasses.dataclass
+# slots was added to python 3.10
+_DATACLASS_KWARGS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclasses.dataclass(**_DATACLASS_KWARGS)
 class StrawberrySchemaDirective:
     python_name: str
     graphql_name: Optional[str]
-    locations: List[Location]
+    locations: Tuple[Location, ...]
     fields: List["StrawberryField"]
     description_sources: Optional[DescriptionSources] = None
     description: Optional[str] = None
@@ -65,7 +72,7 @@ def schema_directive(
         cls.__strawberry_directive__ = StrawberrySchemaDirective(
             python_name=cls.__name__,
             graphql_name=name,
-            locations=locations,
+            locations=tuple(locations),
             description_sources=description_sources,
             description=description,
             docstring=docstring,
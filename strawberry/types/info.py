@@ -8,7 +8,6 @@ from graphql.language import FieldNode
 from graphql.pyutils.path import Path
 
 from strawberry.type import StrawberryType
-from strawberry.utils.cached_property import cached_property
 
 
 if TYPE_CHECKING:
@@ -24,6 +23,9 @@ RootValueType = TypeVar("RootValueType")
 
 @dataclasses.dataclass
 class Info(Generic[ContextType, RootValueType]):
+    # One of these is created for every resolved field, so keep them small
+    __slots__ = ("_raw_info", "_field", "_selected_fields")
+
     _raw_info: GraphQLResolveInfo
     _field: "StrawberryField"
 
@@ -44,10 +46,16 @@ class Info(Generic[ContextType, RootValueType]):
 
         return self._raw_info.field_nodes
 
-    @cached_property
+    @property
     def selected_fields(self) -> List[Selection]:
-        info = self._raw_info
-        return convert_selections(info, info.field_nodes)
+        try:
+            return self._selected_fields
+        except AttributeError:
+            info = self._raw_info
+            self._selected_fields: List[Selection] = convert_selections(
+                info, info.field_nodes
+            )
+            return self._selected_fields
 
     @property
     def context(self) -> ContextType:
@@ -0,0 +1,29 @@
+from typing import Dict, Generic, List, Optional, TypeVar
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class IdentityDict(Generic[K, V]):
+    """
+    A mapping that looks up its keys by identity instead of equality.
+
+    This works for unhashable keys, and for keys that compare equal to other
+    objects (e.g. dataclasses). The keys are kept alive by the mapping, so their
+    ids can't be reused while they're in it.
+    """
+
+    __slots__ = ("_values", "_keys")
+
+    def __init__(self) -> None:
+        self._values: Dict[int, V] = {}
+        self._keys: List[K] = []
+
+    def get(self, key: K) -> Optional[V]:
+        return self._values.get(id(key))
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if id(key) not in self._values:
+            self._keys.append(key)
+        self._values[id(key)] = value
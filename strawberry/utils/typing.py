@@ -63,11 +63,13 @@ def get_list_annotation(annotation: Type) -> Type:
     return annotation.__args__[0]
 
 
+_IGNORED_GENERICS = frozenset((list, tuple, Union, ClassVar, AsyncGenerator))
+
+
 def is_concrete_generic(annotation: type) -> bool:
-    ignored_generics = (list, tuple, Union, ClassVar, AsyncGenerator)
     return (
         isinstance(annotation, _GenericAlias)
-        and annotation.__origin__ not in ignored_generics
+        and annotation.__origin__ not in _IGNORED_GENERICS
     )
 
 
@@ -350,3 +350,34 @@ def test_error_type_with_matrix_list_of_scalar():
     )
 
     assert field.type.of_type.of_type.of_type.of_type.of_type.of_type is str
+
+
+def test_error_type_with_duplicated_field():
+    class UserModel(pydantic.BaseModel):
+        name: str
+        age: int
+
+    with pytest.raises(TypeError, match="Field name duplicated: 'name'"):
+
+        @strawberry.experimental.pydantic.error_type(UserModel, all_fields=True)
+        class UserError:
+            name: str = "foo"
+
+
+def test_error_type_keeps_class_defaults():
+    class UserModel(pydantic.BaseModel):
+        name: str
+        age: int
+
+    @strawberry.experimental.pydantic.error_type(UserModel)
+    class UserError:
+        name: strawberry.auto = ("invalid",)  # type: ignore
+        age: strawberry.auto
+
+    [field1, field2] = UserError._type_definition.fields
+
+    assert field1.python_name == "name"
+    assert field1.default == ("invalid",)
+
+    assert field2.python_name == "age"
+    assert field2.default is None
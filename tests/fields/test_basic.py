@@ -3,6 +3,7 @@ from typing import List
 import pytest
 
 import strawberry
+from strawberry.annotation import StrawberryAnnotation
 from strawberry.exceptions import InvalidDefaultFactoryError
 
 
@@ -114,3 +115,70 @@ def test_field_with_default_factory():
 
     with pytest.raises(InvalidDefaultFactoryError):
         strawberry.field(default_factory=round)
+
+
+@pytest.mark.parametrize(
+    "default_factory",
+    [
+        lambda value: value,
+        lambda *, value: value,
+        lambda value, other=None: value,
+    ],
+)
+def test_field_default_factory_with_required_arguments(default_factory):
+    with pytest.raises(InvalidDefaultFactoryError):
+        strawberry.field(default_factory=default_factory)
+
+
+def test_field_default_factory_with_optional_arguments():
+    class Factory:
+        def create(self, value: int = 3) -> int:
+            return value
+
+    def keyword_factory(*, value: int = 4) -> int:
+        return value
+
+    def variadic_factory(*args, **kwargs) -> int:
+        return 5
+
+    fields = [
+        strawberry.field(default_factory=Factory().create),
+        strawberry.field(default_factory=keyword_factory),
+        strawberry.field(default_factory=variadic_factory),
+        strawberry.field(default_factory=dict),
+    ]
+
+    assert [field.default_value for field in fields] == [3, 4, 5, {}]
+
+
+def test_field_default_factory_is_called_lazily():
+    calls = []
+
+    def factory() -> List[str]:
+        calls.append(None)
+        return []
+
+    @strawberry.type
+    class Query:
+        the_list: List[str] = strawberry.field(default_factory=factory)
+
+    assert calls == []
+
+    [field] = Query._type_definition.fields
+    assert field.default_value == []
+    assert field.default_value == []
+    assert calls == [None]
+
+
+def test_field_type_follows_type_annotation_changes():
+    @strawberry.type
+    class Query:
+        name: str
+
+    [field] = Query._type_definition.fields
+
+    assert field.type is str
+
+    field.type_annotation = StrawberryAnnotation(int)
+
+    assert field.type is int
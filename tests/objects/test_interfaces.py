@@ -114,3 +114,44 @@ def test_interfaces_can_implement_other_interfaces():
         UserNodeInterface._type_definition,
         Node._type_definition,
     ]
+
+
+def test_interface_inherited_through_diamond_is_listed_once():
+    @strawberry.interface
+    class Node:
+        id: strawberry.ID
+
+    @strawberry.interface
+    class Named(Node):
+        name: str
+
+    @strawberry.interface
+    class Aged(Node):
+        age: int
+
+    @strawberry.type
+    class Person(Named, Aged):
+        pass
+
+    definition = Person._type_definition
+    assert definition.interfaces == [
+        Named._type_definition,
+        Aged._type_definition,
+        Node._type_definition,
+    ]
+
+
+def test_interface_inherited_through_undecorated_mixin():
+    @strawberry.interface
+    class Node:
+        id: strawberry.ID
+
+    class NodeMixin(Node):
+        pass
+
+    @strawberry.type
+    class Person(NodeMixin):
+        name: str
+
+    definition = Person._type_definition
+    assert definition.interfaces == [Node._type_definition]
@@ -401,3 +401,134 @@ def test_enum_deprecated_value():
         {"deprecationReason": "We ran out", "isDeprecated": True, "name": "STRAWBERRY"},
         {"deprecationReason": None, "isDeprecated": False, "name": "CHOCOLATE"},
     ]
+
+
+def test_enum_aliases_are_not_valid_values():
+    @strawberry.enum
+    class Color(Enum):
+        RED = "red"
+        CRIMSON = "red"
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def echo(self, color: Color) -> Color:
+            return color
+
+    schema = strawberry.Schema(query=Query)
+
+    result = schema.execute_sync("{ echo(color: RED) }")
+
+    assert not result.errors
+    assert result.data["echo"] == "RED"
+
+    result = schema.execute_sync("{ echo(color: CRIMSON) }")
+
+    assert result.errors
+    assert result.errors[0].message == "Value 'CRIMSON' does not exist in 'Color' enum."
+
+    result = schema.execute_sync(
+        "query ($color: Color!) { echo(color: $color) }",
+        variable_values={"color": "CRIMSON"},
+    )
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "Variable '$color' got invalid value 'CRIMSON'; "
+        "Value 'CRIMSON' does not exist in 'Color' enum."
+    )
+
+
+def test_enum_value_members_as_arguments():
+    @strawberry.enum
+    class IceCreamFlavour(Enum):
+        VANILLA = "vanilla"
+        STRAWBERRY = strawberry.enum_value("strawberry", description="Our favourite")
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def flavour(self, flavour: IceCreamFlavour) -> str:
+            assert flavour is IceCreamFlavour.STRAWBERRY
+            return flavour.name
+
+    schema = strawberry.Schema(query=Query)
+
+    result = schema.execute_sync("{ flavour(flavour: STRAWBERRY) }")
+
+    assert not result.errors
+    assert result.data["flavour"] == "STRAWBERRY"
+
+    result = schema.execute_sync(
+        "query ($flavour: IceCreamFlavour!) { flavour(flavour: $flavour) }",
+        variable_values={"flavour": "STRAWBERRY"},
+    )
+
+    assert not result.errors
+    assert result.data["flavour"] == "STRAWBERRY"
+
+
+def test_enum_serialize_invalid_value():
+    @strawberry.enum
+    class IceCreamFlavour(Enum):
+        VANILLA = "vanilla"
+        STRAWBERRY = "strawberry"
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def plain_value(self) -> IceCreamFlavour:
+            return "vanilla"  # type: ignore
+
+        @strawberry.field
+        def invalid_value(self) -> IceCreamFlavour:
+            return "chocolate"  # type: ignore
+
+        @strawberry.field
+        def unhashable_value(self) -> IceCreamFlavour:
+            return []  # type: ignore
+
+    schema = strawberry.Schema(query=Query)
+
+    result = schema.execute_sync("{ plainValue }")
+
+    assert not result.errors
+    assert result.data["plainValue"] == "VANILLA"
+
+    result = schema.execute_sync("{ invalidValue }")
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "Enum 'IceCreamFlavour' cannot represent value: 'chocolate'"
+    )
+
+    result = schema.execute_sync("{ unhashableValue }")
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "Enum 'IceCreamFlavour' cannot represent value: []"
+    )
+
+
+def test_enum_values_are_not_shared_between_schemas():
+    @strawberry.enum
+    class IceCreamFlavour(Enum):
+        VANILLA = "vanilla"
+        STRAWBERRY = "strawberry"
+
+    @strawberry.type
+    class Query:
+        flavour: IceCreamFlavour = IceCreamFlavour.VANILLA
+
+    schema = strawberry.Schema(query=Query)
+    other_schema = strawberry.Schema(query=Query)
+
+    values = schema._schema.get_type("IceCreamFlavour").values  # type: ignore
+    other_values = other_schema._schema.get_type(  # type: ignore
+        "IceCreamFlavour"
+    ).values
+
+    values["VANILLA"].deprecation_reason = "Changed in one schema"
+
+    assert other_values["VANILLA"] is not values["VANILLA"]
+    assert other_values["VANILLA"].deprecation_reason is None
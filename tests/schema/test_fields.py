@@ -3,7 +3,9 @@ from operator import getitem
 
 import strawberry
 from strawberry.field import StrawberryField
+from strawberry.permission import BasePermission
 from strawberry.schema.config import StrawberryConfig
+from strawberry.types.info import get_info
 
 
 def test_custom_field():
@@ -72,6 +74,29 @@ def test_can_change_default_resolver():
     assert result.data["user"]["name"] == "Patrick"
 
 
+def test_default_resolver_of_field_with_permissions_gets_current_info():
+    class AllowAll(BasePermission):
+        def has_permission(self, source, info, **kwargs) -> bool:
+            return True
+
+    def default_resolver(source, name):
+        return f"info={get_info().field_name}"
+
+    @strawberry.type
+    class Query:
+        a: str = strawberry.field(permission_classes=[AllowAll], default="x")
+
+    schema = strawberry.Schema(
+        query=Query,
+        config=StrawberryConfig(default_resolver=default_resolver),
+    )
+
+    result = schema.execute_sync("{ a }", root_value=Query())
+
+    assert not result.errors
+    assert result.data == {"a": "info=a"}
+
+
 def test_field_metadata():
     @strawberry.type
     class Query:
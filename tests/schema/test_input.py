@@ -1,6 +1,7 @@
 from typing import Optional
 
 import strawberry
+from strawberry.schema.config import StrawberryConfig
 
 
 def test_renaming_input_fields():
@@ -27,3 +28,39 @@ def test_renaming_input_fields():
     assert not result.errors
     assert result.data
     assert result.data["filter"] == "Hello nope"
+
+
+def test_input_type_shared_between_schemas():
+    @strawberry.input
+    class GreetingInput:
+        first_name: str
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def greet(self, input: GreetingInput) -> str:
+            return f"Hello {input.first_name}"
+
+    camel_case_schema = strawberry.Schema(query=Query)
+    snake_case_schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(auto_camel_case=False)
+    )
+
+    for _ in range(2):
+        result = camel_case_schema.execute_sync(
+            '{ greet(input: { firstName: "Patrick" }) }'
+        )
+        assert not result.errors
+        assert result.data == {"greet": "Hello Patrick"}
+
+        result = snake_case_schema.execute_sync(
+            '{ greet(input: { first_name: "Patrick" }) }'
+        )
+        assert not result.errors
+        assert result.data == {"greet": "Hello Patrick"}
+
+    # Each schema keeps its own converter for the input type
+    assert (
+        camel_case_schema.schema_converter._input_converters[GreetingInput]
+        is not snake_case_schema.schema_converter._input_converters[GreetingInput]
+    )
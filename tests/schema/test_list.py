@@ -1,6 +1,7 @@
 from typing import List, Optional
 
 import strawberry
+from strawberry.type import StrawberryList
 
 
 def test_basic_list():
@@ -53,3 +54,23 @@ def test_lists_of_lists():
 
     assert not result.errors
     assert result.data["polygons"] == [[2.0, 6.0]]
+
+
+def test_list_subclass():
+    class CustomList(StrawberryList):
+        pass
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def example(self, values: CustomList(int)) -> CustomList(str):  # type: ignore
+            return [str(value) for value in values]
+
+    schema = strawberry.Schema(query=Query)
+
+    assert "example(values: [Int!]!): [String!]!" in str(schema)
+
+    result = schema.execute_sync("{ example(values: [1, 2]) }")
+
+    assert not result.errors
+    assert result.data == {"example": ["1", "2"]}
@@ -376,3 +376,54 @@ def test_annotated_permission():
     assert (
         schema.execute_sync("{ resolverDenied }").errors[0].message == "Access denied"
     )
+
+
+@pytest.mark.asyncio
+async def test_permission_classes_without_base_permission():
+    class IsAuthorized:
+        message = "User is not authorized"
+
+        async def has_permission(self, source, info, **kwargs) -> bool:
+            return info.context["user"] == "Patrick"
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(permission_classes=[IsAuthorized])  # type: ignore
+        def name(self) -> str:
+            return "patrick"
+
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ name }", context_value={"user": "Patrick"})
+    assert result.data["name"] == "patrick"
+
+    result = await schema.execute("{ name }", context_value={"user": "Marco"})
+    assert result.errors[0].message == "User is not authorized"
+
+
+@pytest.mark.asyncio
+async def test_replaced_has_permission_method():
+    class IsAuthorized(BasePermission):
+        message = "User is not authorized"
+
+        def has_permission(self, source, info, **kwargs) -> bool:
+            return True
+
+    async def has_permission(self, source, info, **kwargs) -> bool:
+        return info.context["user"] == "Patrick"
+
+    IsAuthorized.has_permission = has_permission  # type: ignore
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(permission_classes=[IsAuthorized])
+        def name(self) -> str:
+            return "patrick"
+
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ name }", context_value={"user": "Patrick"})
+    assert result.data["name"] == "patrick"
+
+    result = await schema.execute("{ name }", context_value={"user": "Marco"})
+    assert result.errors[0].message == "User is not authorized"
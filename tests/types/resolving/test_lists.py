@@ -192,3 +192,15 @@ def test_tuple_builtin():
     assert resolved == StrawberryList(of_type=str)
     assert resolved == Tuple[str]
     assert resolved == tuple[str]
+
+
+def test_list_subclass():
+    class CustomList(StrawberryList):
+        pass
+
+    custom_list = CustomList(of_type=str)
+
+    annotation = StrawberryAnnotation(custom_list)
+    resolved = annotation.resolve()
+
+    assert resolved is custom_list
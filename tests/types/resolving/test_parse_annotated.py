@@ -1,8 +1,9 @@
 from typing import List, Optional, Union
 
-from typing_extensions import Annotated
+from typing_extensions import Annotated, get_args
 
-from strawberry.annotation import StrawberryAnnotation
+from strawberry.annotation import StrawberryAnnotation, _parse_annotated_cached
+from strawberry.lazy_type import LazyType, lazy
 
 
 def test_parse_annotated():
@@ -68,3 +69,30 @@ def test_parse_annotated_recursive():
         )
         == Annotated[List[Annotated[Union[str, int], "bar"]], "foo"]
     )
+
+
+def test_parse_annotated_is_cached_by_identity():
+    annotation = Union[str, int]
+    swapped_annotation = Union[int, str]
+
+    # both unions are equal, but the order of the types must be kept
+    assert StrawberryAnnotation.parse_annotated(annotation) == Union[str, int]
+    assert get_args(StrawberryAnnotation.parse_annotated(swapped_annotation)) == (
+        int,
+        str,
+    )
+
+
+def test_parse_annotated_lazy_reference_is_not_cached():
+    annotation = Annotated["TypeA", lazy("tests.schema.test_lazy.type_a")]
+
+    cache_size = _parse_annotated_cached.cache_info().currsize
+
+    for _ in range(2):
+        lazy_type = StrawberryAnnotation.parse_annotated(annotation)
+
+        assert isinstance(lazy_type, LazyType)
+        assert lazy_type.type_name == "TypeA"
+        assert lazy_type.module == "tests.schema.test_lazy.type_a"
+
+    assert _parse_annotated_cached.cache_info().currsize == cache_size
@@ -0,0 +1,22 @@
+from typing import List, Optional
+
+from strawberry.annotation import StrawberryAnnotation
+from strawberry.type import StrawberryList
+
+
+def test_resolve_is_cached():
+    annotation = StrawberryAnnotation(List[str])
+
+    resolved = annotation.resolve()
+
+    assert isinstance(resolved, StrawberryList)
+    assert annotation.resolve() is resolved
+
+
+def test_resolve_cache_is_per_instance():
+    first = StrawberryAnnotation(Optional[str])
+    second = StrawberryAnnotation(Optional[str])
+
+    assert first.resolve() is not second.resolve()
+    assert first.resolve() == second.resolve()
+    assert hash(first) == hash(second)
@@ -5,10 +5,15 @@ from typing_extensions import Annotated
 
 import strawberry
 from strawberry.annotation import StrawberryAnnotation
-from strawberry.arguments import StrawberryArgument, convert_arguments
+from strawberry.arguments import (
+    StrawberryArgument,
+    compile_arguments_converter,
+    convert_arguments,
+)
 from strawberry.lazy_type import LazyType
 from strawberry.schema.config import StrawberryConfig
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
+from strawberry.type import StrawberryList, StrawberryOptional
 from strawberry.unset import UNSET
 
 
@@ -415,3 +420,96 @@ def test_when_optional():
         )
         == {}
     )
+
+
+def test_input_types_with_different_name_converters():
+    @strawberry.input
+    class MyInput:
+        first_name: str
+
+    arguments = [
+        StrawberryArgument(
+            graphql_name="input",
+            python_name="input",
+            type_annotation=StrawberryAnnotation(MyInput),
+        ),
+    ]
+
+    assert convert_arguments(
+        {"input": {"firstName": "Patrick"}},
+        arguments,
+        scalar_registry=DEFAULT_SCALAR_REGISTRY,
+        config=StrawberryConfig(),
+    ) == {"input": MyInput(first_name="Patrick")}
+
+    assert convert_arguments(
+        {"input": {"first_name": "Patrick"}},
+        arguments,
+        scalar_registry=DEFAULT_SCALAR_REGISTRY,
+        config=StrawberryConfig(auto_camel_case=False),
+    ) == {"input": MyInput(first_name="Patrick")}
+
+
+def test_compiled_arguments_converter():
+    @strawberry.input
+    class MyInput:
+        abc: str
+
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="integer_list",
+            type_annotation=StrawberryAnnotation(List[int]),
+        ),
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="input",
+            type_annotation=StrawberryAnnotation(Optional[MyInput]),
+        ),
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="missing",
+            type_annotation=StrawberryAnnotation(Optional[str]),
+        ),
+    ]
+
+    convert = compile_arguments_converter(
+        arguments,
+        scalar_registry=DEFAULT_SCALAR_REGISTRY,
+        config=StrawberryConfig(),
+    )
+
+    assert convert({"integerList": [1, 2], "input": {"abc": "example"}}) == {
+        "integer_list": [1, 2],
+        "input": MyInput(abc="example"),
+    }
+    assert convert({"input": None}) == {"input": None}
+
+
+def test_subclasses_of_strawberry_types():
+    class CustomList(StrawberryList):
+        pass
+
+    class CustomOptional(StrawberryOptional):
+        pass
+
+    @strawberry.input
+    class MyInput:
+        abc: str
+
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="inputs",
+            type_annotation=StrawberryAnnotation(
+                CustomOptional(CustomList(MyInput))  # type: ignore
+            ),
+        ),
+    ]
+
+    assert convert_arguments(
+        {"inputs": [{"abc": "example"}]},
+        arguments,
+        scalar_registry=DEFAULT_SCALAR_REGISTRY,
+        config=StrawberryConfig(),
+    ) == {"inputs": [MyInput(abc="example")]}
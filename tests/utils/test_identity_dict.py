@@ -0,0 +1,41 @@
+import dataclasses
+
+from strawberry.utils.identity_dict import IdentityDict
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+
+
+def test_unhashable_keys():
+    point = Point(1)
+    mapping: IdentityDict[Point, str] = IdentityDict()
+
+    mapping[point] = "a"
+
+    assert mapping.get(point) == "a"
+
+
+def test_equal_keys_are_different():
+    first = Point(1)
+    second = Point(1)
+    mapping: IdentityDict[Point, str] = IdentityDict()
+
+    mapping[first] = "a"
+
+    assert mapping.get(second) is None
+
+    mapping[second] = "b"
+
+    assert mapping.get(first) == "a"
+    assert mapping.get(second) == "b"
+
+
+def test_keys_are_kept_alive():
+    mapping: IdentityDict[Point, str] = IdentityDict()
+
+    mapping[Point(1)] = "a"
+    mapping[Point(2)] = "b"
+
+    assert len({id(key) for key in mapping._keys}) == 2